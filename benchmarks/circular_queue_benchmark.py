@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+##
+# Circular Queue Benchmark
+##
+'''
+Measures the throughput of a BlockingCircularQueue shared by 1, 4 and 16
+producer/consumer thread pairs, moving the elements one at a time with
+put/get and in batches with put_many/get_many.
+
+Run from the repository root:
+    python benchmarks/circular_queue_benchmark.py
+'''
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from circular_queue import BlockingCircularQueue
+
+
+def run_pairs(pairs, messages, batch, capacity=1024):
+    """
+    Moves `messages` elements through one queue with the given number of
+    producer and consumer threads, and times it.
+
+    Parameters:
+    pairs (int): The number of producer/consumer pairs.
+    messages (int): The total number of elements moved.
+    batch (int): The number of elements per call, or 1 for put/get.
+    capacity (int): The capacity of the queue.
+
+    Returns:
+    float: The number of elements moved per second.
+    """
+    queue = BlockingCircularQueue(capacity)
+    per_pair = messages // pairs
+    data = np.arange(per_pair)
+
+    def produce():
+        if batch == 1:
+            for value in data.tolist():
+                queue.put(value)
+        else:
+            for position in range(0, per_pair, batch):
+                queue.put_many(data[position:position + batch])
+
+    def consume():
+        received = 0
+        while received < per_pair:
+            if batch == 1:
+                queue.get()
+                received += 1
+            else:
+                received += queue.get_many(min(batch, per_pair - received)).size
+
+    threads = [threading.Thread(target=produce) for _ in range(pairs)]
+    threads += [threading.Thread(target=consume) for _ in range(pairs)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return per_pair * pairs / elapsed
+
+
+def benchmark_pairs(pair_counts=(1, 4, 16), messages=2 * 10 ** 5, batches=(1, 256)):
+    """
+    Prints the throughput for each number of pairs and batch size.
+
+    Parameters:
+    pair_counts (tuple): The numbers of producer/consumer pairs.
+    messages (int): The total number of elements moved in each run.
+    batches (tuple): The batch sizes, 1 meaning put/get.
+    """
+    print(f'{"pairs":>6} {"batch":>6} {"elements/s":>14}')
+    for pairs in pair_counts:
+        for batch in batches:
+            # Batches move far more elements in the same time
+            count = messages if batch == 1 else messages * 50
+            print(f'{pairs:>6} {batch:>6} {run_pairs(pairs, count, batch):>14,.0f}')
+
+
+if __name__ == '__main__':
+    benchmark_pairs()
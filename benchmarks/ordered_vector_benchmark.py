@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+##
+# Ordered Vector Benchmark
+##
+'''
+Measures how many inserts per second an OrderedVector sustains when it
+already holds n elements, for n from 10^3 to 10^6, compares batched
+lookups with binary_search_many against a loop of binary_search calls, and
+compares the insertion rate of the contiguous and chunked backends.
+
+Run from the repository root:
+    python benchmarks/ordered_vector_benchmark.py
+'''
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from ordered_vector import ChunkedOrderedVector, OrderedVector
+
+
+def filled_vector(size, extra, rng):
+    """
+    Builds an ordered vector holding `size` sorted random values, with room
+    for `extra` more insertions.
+
+    Parameters:
+    size (int): The number of elements already in the vector.
+    extra (int): The number of free positions left for the benchmark.
+    rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+    OrderedVector: The prepared vector.
+    """
+    vector = OrderedVector(size + extra)
+    vector.values[:size] = np.sort(rng.integers(0, 10 * size, size))
+    vector.last_position = size - 1
+    return vector
+
+
+def benchmark_insert(sizes, inserts=1000, seed=0):
+    """
+    Times `inserts` random insertions into vectors of the given sizes.
+
+    Parameters:
+    sizes (list): The vector sizes to benchmark.
+    inserts (int): The number of insertions timed for each size.
+    seed (int): The seed of the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+    print(f'{"size":>10} {"inserts/s":>14}')
+    for size in sizes:
+        vector = filled_vector(size, inserts, rng)
+        keys = rng.integers(0, 10 * size, inserts).tolist()
+
+        start = time.perf_counter()
+        for key in keys:
+            vector.insert(key)
+        elapsed = time.perf_counter() - start
+
+        print(f'{size:>10} {inserts / elapsed:>14,.0f}')
+
+
+def benchmark_binary_search_many(size=10 ** 6, lookups=10 ** 5, seed=0):
+    """
+    Times `lookups` searches done with a loop of binary_search calls and
+    with a single binary_search_many call.
+
+    Parameters:
+    size (int): The number of elements in the vector.
+    lookups (int): The number of keys searched.
+    seed (int): The seed of the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+    vector = filled_vector(size, 0, rng)
+    keys = rng.integers(0, 10 * size, lookups)
+
+    start = time.perf_counter()
+    for key in keys.tolist():
+        vector.binary_search(key)
+    looped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vector.binary_search_many(keys)
+    batched = time.perf_counter() - start
+
+    print(f'{lookups} lookups in {size} elements')
+    print(f'{"binary_search loop":>20} {looped:>10.4f} s')
+    print(f'{"binary_search_many":>20} {batched:>10.4f} s ({looped / batched:,.0f}x)')
+
+
+def benchmark_chunked(sizes, inserts=10000, chunk_size=1024, seed=0):
+    """
+    Times `inserts` random insertions into a contiguous OrderedVector and
+    into a ChunkedOrderedVector already holding the same elements.
+
+    Parameters:
+    sizes (list): The vector sizes to benchmark.
+    inserts (int): The number of insertions timed for each size.
+    chunk_size (int): The chunk size of the chunked backend.
+    seed (int): The seed of the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+    print(f'{"size":>10} {"contiguous/s":>14} {"chunked/s":>14}')
+    for size in sizes:
+        contiguous = filled_vector(size, inserts, rng)
+        chunked = ChunkedOrderedVector(chunk_size)
+        chunked.insert_many(contiguous.values[:size])
+        keys = rng.integers(0, 10 * size, inserts).tolist()
+
+        rates = []
+        for vector in (contiguous, chunked):
+            start = time.perf_counter()
+            for key in keys:
+                vector.insert(key)
+            rates.append(inserts / (time.perf_counter() - start))
+
+        print(f'{size:>10} {rates[0]:>14,.0f} {rates[1]:>14,.0f}')
+
+
+if __name__ == '__main__':
+    benchmark_insert([10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+    print()
+    benchmark_binary_search_many()
+    print()
+    benchmark_chunked([10 ** 5, 10 ** 6, 10 ** 7])
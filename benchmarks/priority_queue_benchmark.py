@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+##
+# Priority Queue Benchmark
+##
+'''
+Compares the sorted-array PriorityQueue with the binary-heap
+HeapPriorityQueue, timing random mixes of enqueues and dequeues on queues
+that already hold n elements, for n from 10^3 to 10^6. The sorted array
+shifts elements with a Python loop, so its 10^6 cases take a few minutes.
+
+Run from the repository root:
+    python benchmarks/priority_queue_benchmark.py
+'''
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from priority_queue import HeapPriorityQueue, PriorityQueue
+
+
+def filled_queue(queue_class, size, extra, rng):
+    """
+    Builds a priority queue holding `size` random values, with room for
+    `extra` more enqueues.
+
+    An ascending array is a valid min-heap, and its reverse is the order
+    PriorityQueue keeps, so both are filled without enqueueing.
+
+    Parameters:
+    queue_class (type): PriorityQueue or HeapPriorityQueue.
+    size (int): The number of elements already in the queue.
+    extra (int): The number of free positions left for the benchmark.
+    rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+    The prepared queue.
+    """
+    queue = queue_class(size + extra)
+    values = np.sort(rng.integers(0, 10 * size, size))
+    queue.values[:size] = values[::-1] if queue_class is PriorityQueue else values
+    queue.number_of_elements = size
+    return queue
+
+
+def benchmark_mix(sizes, insert_ratios, operations=500, seed=0):
+    """
+    Times `operations` random enqueues and dequeues on each backend, for
+    each queue size and share of enqueues.
+
+    Parameters:
+    sizes (list): The queue sizes to benchmark.
+    insert_ratios (list): The shares of the operations that are enqueues.
+    operations (int): The number of operations timed for each case.
+    seed (int): The seed of the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+    print(f'{"size":>10} {"enqueues":>9} {"sorted ops/s":>14} {"heap ops/s":>14} {"speedup":>8}')
+    for size in sizes:
+        for insert_ratio in insert_ratios:
+            is_insert = (rng.random(operations) < insert_ratio).tolist()
+            keys = rng.integers(0, 10 * size, operations).tolist()
+
+            rates = []
+            for queue_class in (PriorityQueue, HeapPriorityQueue):
+                queue = filled_queue(queue_class, size, operations, np.random.default_rng(seed))
+                start = time.perf_counter()
+                for insert, key in zip(is_insert, keys):
+                    if insert:
+                        queue.enqueue(key)
+                    else:
+                        queue.dequeue()
+                rates.append(operations / (time.perf_counter() - start))
+
+            print(f'{size:>10} {insert_ratio:>9.0%} {rates[0]:>14,.0f} {rates[1]:>14,.0f} '
+                  f'{rates[1] / rates[0]:>7.1f}x')
+
+
+if __name__ == '__main__':
+    benchmark_mix([10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6], [0.9, 0.5, 0.1])
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+##
+# Shared Circular Queue Benchmark
+##
+'''
+Measures how fast 10^7 int64 messages go from one process to another
+through a SharedCircularQueue, in batches written and read in place, and
+through a multiprocessing.Queue, one message at a time and in pickled
+numpy batches.
+
+Run from the repository root:
+    python benchmarks/shared_queue_benchmark.py
+'''
+
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from circular_queue import SharedCircularQueue
+
+
+def shared_consumer(name, messages, results):
+    """
+    Reads `messages` elements from a shared queue in place and sends back
+    their sum.
+
+    Parameters:
+    name (str): The name of the shared queue.
+    messages (int): The number of elements to read.
+    results (multiprocessing.Queue): Where the sum is sent.
+    """
+    queue = SharedCircularQueue.attach(name)
+    total = 0
+    received = 0
+    while received < messages:
+        count = 0
+        for view in queue.readable_views(messages - received):
+            total += int(view.sum())
+            count += view.size
+        del view
+        if count == 0:
+            # Give the producer the CPU instead of spinning
+            time.sleep(0)
+            continue
+        queue.commit_read(count)
+        received += count
+    queue.close()
+    results.put(total)
+
+
+def queue_consumer(source, messages, batched, results):
+    """
+    Reads `messages` elements from a multiprocessing.Queue and sends back
+    their sum.
+
+    Parameters:
+    source (multiprocessing.Queue): The queue to read from.
+    messages (int): The number of elements to read.
+    batched (bool): Whether the queue carries numpy arrays or single values.
+    results (multiprocessing.Queue): Where the sum is sent.
+    """
+    total = 0
+    received = 0
+    while received < messages:
+        if batched:
+            values = source.get()
+            total += int(values.sum())
+            received += values.size
+        else:
+            total += source.get()
+            received += 1
+    results.put(total)
+
+
+def benchmark_shared(messages, batch=1 << 16, capacity=1 << 20):
+    """
+    Times `messages` elements going through a SharedCircularQueue.
+
+    Parameters:
+    messages (int): The number of elements sent.
+    batch (int): The maximum number of elements written at once.
+    capacity (int): The capacity of the queue.
+
+    Returns:
+    float: The number of messages per second.
+    """
+    queue = SharedCircularQueue(capacity, dtype=np.int64)
+    results = multiprocessing.Queue()
+    consumer = multiprocessing.Process(target=shared_consumer, args=(queue.name, messages, results))
+    consumer.start()
+
+    start = time.perf_counter()
+    data = np.arange(messages, dtype=np.int64)
+    sent = 0
+    while sent < messages:
+        count = 0
+        for view in queue.writable_views(min(batch, messages - sent)):
+            view[:] = data[sent + count:sent + count + view.size]
+            count += view.size
+        if count == 0:
+            time.sleep(0)
+            continue
+        queue.commit_write(count)
+        sent += count
+    total = results.get()
+    elapsed = time.perf_counter() - start
+
+    consumer.join()
+    del view
+    queue.close()
+    queue.unlink()
+    assert total == messages * (messages - 1) // 2
+    return messages / elapsed
+
+
+def benchmark_queue(messages, batch=None):
+    """
+    Times `messages` elements going through a multiprocessing.Queue.
+
+    Parameters:
+    messages (int): The number of elements sent.
+    batch (int): The number of elements per numpy array sent, or None to
+    send the elements one at a time.
+
+    Returns:
+    float: The number of messages per second.
+    """
+    source = multiprocessing.Queue(maxsize=1024)
+    results = multiprocessing.Queue()
+    consumer = multiprocessing.Process(target=queue_consumer,
+                                       args=(source, messages, batch is not None, results))
+    consumer.start()
+
+    start = time.perf_counter()
+    if batch is None:
+        for value in range(messages):
+            source.put(value)
+    else:
+        data = np.arange(messages, dtype=np.int64)
+        for position in range(0, messages, batch):
+            source.put(data[position:position + batch])
+    total = results.get()
+    elapsed = time.perf_counter() - start
+
+    consumer.join()
+    assert total == messages * (messages - 1) // 2
+    return messages / elapsed
+
+
+if __name__ == '__main__':
+    messages = 10 ** 7
+    print(f'{"transport":>32} {"messages/s":>14}')
+    print(f'{"SharedCircularQueue, in place":>32} {benchmark_shared(messages):>14,.0f}')
+    print(f'{"multiprocessing.Queue, batches":>32} {benchmark_queue(messages, 1 << 16):>14,.0f}')
+    print(f'{"multiprocessing.Queue, single":>32} {benchmark_queue(messages):>14,.0f}')
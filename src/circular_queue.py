@@ -0,0 +1,1056 @@
+#!/usr/bin/env python3
+
+##
+# Circular Queue
+##
+
+import asyncio
+import multiprocessing
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from queue import Empty, Full
+
+import numpy as np
+
+from errors import QueueEmptyError, QueueFullError
+from growable_array import GrowableArray
+
+# Layout of the header at the start of a shared-memory queue. The tail and
+# head counters sit on their own cache lines, at SHARED_TAIL_OFFSET and
+# SHARED_HEAD_OFFSET bytes, so the producer and the consumer do not write to
+# the same line; the elements follow, starting at SHARED_HEADER_SIZE bytes
+SHARED_HEADER = np.dtype([('magic', 'S8'), ('dtype', 'S8'), ('capacity', '<i8')])
+SHARED_TAIL_OFFSET = 64
+SHARED_HEAD_OFFSET = 128
+SHARED_HEADER_SIZE = 192
+SHARED_MAGIC = b'DSACQU01'
+
+
+class CircularQueue(GrowableArray):
+    """
+    A class representing a Circular Queue (FIFO structure with wrapping capability).
+    
+    A Circular Queue allows enqueueing and dequeueing elements in a circular manner,
+    where after reaching the end of the array, it wraps around to the beginning.
+
+    Attributes:
+    capacity (int): The maximum capacity of the queue.
+    start (int): The index of the first element in the queue.
+    end (int): The index of the last element in the queue.
+    num_elements (int): The number of elements currently in the queue.
+    values (np.ndarray): An array to hold the elements of the queue.
+    growth_factor (float): The factor the capacity grows by when the queue
+    is full, or None for a fixed capacity.
+    shrink_threshold (float): The fraction of the capacity below which the
+    queue shrinks after a dequeue, or None to never shrink.
+    minimum_capacity (int): The capacity the queue never shrinks below.
+    trace (callable): Called as trace(operation, queue) after each enqueue
+    or dequeue, or None.
+
+    Methods:
+    __is_empty(): Checks if the queue is empty.
+    __is_full(): Checks if the queue is full.
+    reserve(capacity): Makes sure the queue can hold a number of elements.
+    enqueue(value): Adds an element to the end of the queue.
+    enqueue_many(array): Adds several elements to the end of the queue.
+    dequeue(): Removes and returns the element from the front of the queue.
+    dequeue_many(k, copy): Removes and returns up to k elements from the front.
+    first(): Returns the element at the front of the queue without removing it.
+    as_views(): Returns the elements as at most two read-only views.
+    to_array(out): Copies the elements, in order, into an array.
+    display(): Prints the elements of the queue.
+    """
+
+    def __init__(self, capacity, dtype=int, growth_factor=None, shrink_threshold=None, trace=None):
+        """
+        Initializes the circular queue with a given capacity.
+
+        Parameters:
+        capacity (int): The initial capacity of the queue.
+        dtype (numpy.dtype): The numeric type of the elements, int (int64)
+        by default. Smaller types such as np.int32 or np.uint16 save memory.
+        growth_factor (float): The factor the capacity grows by when the
+        queue is full, or None for a fixed capacity (see GrowableArray).
+        shrink_threshold (float): The fraction of the capacity below which
+        the queue shrinks after a dequeue, or None to never shrink.
+        trace (callable): A diagnostics hook, called as trace(operation,
+        queue) after each enqueue or dequeue, e.g. to log or display the
+        queue. The default None costs a single check per operation.
+        """
+        super().__init__(capacity, growth_factor, shrink_threshold)
+
+        self.capacity = capacity
+        self.start = 0
+        self.end = -1
+        self.num_elements = 0
+        self.values = np.empty(self.capacity, dtype=dtype)
+        self.trace = trace
+
+    def _resize(self, capacity):
+        """
+        Moves the elements to a new array with the given capacity.
+
+        The elements are copied in queue order, unwrapping the ring, so the
+        first element ends up at index 0.
+
+        Parameters:
+        capacity (int): The new capacity of the queue.
+
+        Time Complexity: O(n), where n is the number of elements in the queue.
+        """
+        values = np.empty(capacity, dtype=self.values.dtype)
+        count = self.num_elements
+        if count > 0:
+            # At most two segments: from start to the end of the array, then
+            # the part that wrapped around to the beginning
+            first_part = min(count, self.capacity - self.start)
+            values[:first_part] = self.values[self.start:self.start + first_part]
+            values[first_part:count] = self.values[:count - first_part]
+
+        self.values = values
+        self.capacity = capacity
+        self.start = 0
+        self.end = count - 1
+
+    def __is_empty(self):
+        """
+        Checks if the queue is empty.
+
+        Returns:
+        bool: True if the queue is empty, otherwise False.
+        """
+        return self.num_elements == 0
+
+    def __is_full(self):
+        """
+        Checks if the queue is full.
+
+        Returns:
+        bool: True if the queue is full, otherwise False.
+        """
+        return self.num_elements == self.capacity
+
+    def enqueue(self, value):
+        """
+        Adds an element to the end of the queue.
+
+        Parameters:
+        value (int): The value to be added to the queue.
+
+        Raises:
+        QueueFullError: If the queue is full and cannot grow.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.__is_full() and not self._ensure_capacity(self.num_elements + 1):
+            raise QueueFullError('The queue is full')
+
+        if self.end == self.capacity - 1:
+            self.end = -1  # Wrap around
+        self.end += 1
+        self.values[self.end] = value
+        self.num_elements += 1
+        if self.trace is not None:
+            self.trace('enqueue', self)
+
+    def dequeue(self):
+        """
+        Removes and returns the element at the front of the queue.
+
+        Returns:
+        int: The element that was dequeued.
+
+        Raises:
+        QueueEmptyError: If the queue is empty.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.__is_empty():
+            raise QueueEmptyError('The queue is empty')
+
+        temp = self.values[self.start]
+        self.start += 1
+        if self.start == self.capacity:
+            self.start = 0  # Wrap around
+        self.num_elements -= 1
+        self._shrink_if_sparse(self.num_elements)
+        if self.trace is not None:
+            self.trace('dequeue', self)
+        return temp
+
+    def enqueue_many(self, array):
+        """
+        Adds several elements to the end of the queue, in order.
+
+        The elements are copied in at most two slices: up to the end of the
+        array, then the part that wraps around to the beginning.
+
+        Parameters:
+        array (array-like): The values to be added to the queue.
+
+        Raises:
+        QueueFullError: If the elements do not fit and the queue cannot grow.
+        None of them are added then.
+
+        Time Complexity: O(k) amortized, where k is the number of elements.
+        """
+        array = np.asarray(array, dtype=self.values.dtype).ravel()
+        count = array.size
+        if count == 0:
+            return
+        if not self._ensure_capacity(self.num_elements + count):
+            raise QueueFullError('The queue is full')
+
+        position = (self.end + 1) % self.capacity
+        first_part = min(count, self.capacity - position)
+        self.values[position:position + first_part] = array[:first_part]
+        self.values[:count - first_part] = array[first_part:]
+        self.end = (position + count - 1) % self.capacity
+        self.num_elements += count
+        if self.trace is not None:
+            self.trace('enqueue_many', self)
+
+    def dequeue_many(self, k, copy=True):
+        """
+        Removes and returns up to k elements from the front of the queue, in
+        order.
+
+        With copy=False, the result is a view into the queue's storage when
+        the elements do not wrap around the end of the array, so nothing is
+        copied. The view is overwritten by later enqueues: use it before
+        adding more elements, or copy it. When the elements wrap around, the
+        two segments are always joined into a new array.
+
+        Parameters:
+        k (int): The number of elements to remove. If the queue holds fewer,
+        all of them are removed.
+        copy (bool): Whether the result must be a new array.
+
+        Returns:
+        np.ndarray: The removed elements, first in first. It is empty if the
+        queue is empty.
+
+        Time Complexity: O(k), or O(1) for a view.
+        """
+        count = min(max(k, 0), self.num_elements)
+        stop = self.start + count
+        if stop <= self.capacity:
+            values = self.values[self.start:stop]
+            if copy:
+                values = values.copy()
+        else:
+            values = np.concatenate((self.values[self.start:], self.values[:stop - self.capacity]))
+
+        if count > 0:
+            self.start = stop % self.capacity
+            self.num_elements -= count
+            self._shrink_if_sparse(self.num_elements)
+            if self.trace is not None:
+                self.trace('dequeue_many', self)
+        return values
+
+    def first(self):
+        """
+        Returns the element at the front of the queue without removing it.
+
+        If the queue is empty, it returns -1.
+
+        Returns:
+        int: The first element of the queue, or -1 if the queue is empty.
+
+        Time Complexity: O(1)
+        """
+        if self.__is_empty():
+            return -1
+        return self.values[self.start]
+
+    def as_views(self):
+        """
+        Returns the elements of the queue, in order, as read-only views into
+        its array, without copying anything.
+
+        The views are only valid until the queue changes: a later enqueue may
+        overwrite them, and a resize moves the elements to a new array.
+
+        Returns:
+        tuple: One view, or two when the elements wrap around the end of the
+        array: from start to the end of the array, then from the beginning.
+
+        Time Complexity: O(1)
+        """
+        count = self.num_elements
+        first_part = min(count, self.capacity - self.start)
+        views = (self.values[self.start:self.start + first_part],)
+        if first_part < count:
+            views += (self.values[:count - first_part],)
+        for view in views:
+            view.flags.writeable = False
+        return views
+
+    def to_array(self, out=None):
+        """
+        Copies the elements of the queue, in order, into an array.
+
+        Parameters:
+        out (np.ndarray): A preallocated array to fill, holding at least as
+        many elements as the queue, or None to allocate a new one.
+
+        Returns:
+        np.ndarray: The elements, first in first. When out is given, it is
+        the start of out that was filled.
+
+        Raises:
+        ValueError: If out is too small.
+
+        Time Complexity: O(n), where n is the number of elements in the queue.
+        """
+        count = self.num_elements
+        if out is None:
+            out = np.empty(count, dtype=self.values.dtype)
+        elif len(out) < count:
+            raise ValueError(f'out holds {len(out)} elements, the queue {count}')
+
+        position = 0
+        for view in self.as_views():
+            out[position:position + view.size] = view
+            position += view.size
+        return out[:count]
+
+    def display(self):
+        """
+        Displays the elements of the queue from start to end in the correct order,
+        accounting for wraparound.
+        """
+        if self.__is_empty():
+            print("The queue is empty")
+            return
+
+        print("Queue elements: ", self.to_array())
+
+
+class BlockingCircularQueue:
+    """
+    A thread-safe, bounded circular queue for producer/consumer pipelines.
+
+    It wraps a fixed-capacity CircularQueue behind a lock. Producers block
+    while the queue is full and consumers block while it is empty, woken
+    through condition variables, so a full queue slows the producers down
+    instead of dropping data. Like the standard library queue.Queue, the
+    blocking calls accept a timeout and raise queue.Full or queue.Empty when
+    it expires.
+
+    Attributes:
+    queue (CircularQueue): The queue holding the elements.
+    lock (threading.Lock): The lock guarding the queue.
+    not_empty (threading.Condition): Notified when elements are added.
+    not_full (threading.Condition): Notified when elements are removed.
+
+    Methods:
+    qsize(): Returns the number of elements in the queue.
+    put(value, block, timeout): Adds an element, waiting for room.
+    put_many(array, block, timeout): Adds several elements, waiting for room.
+    get(block, timeout): Removes and returns the first element, waiting for one.
+    get_many(k, block, timeout): Removes and returns up to k elements.
+    """
+
+    def __init__(self, capacity, dtype=int):
+        """
+        Initializes the blocking queue with a fixed capacity.
+
+        Parameters:
+        capacity (int): The maximum number of elements in the queue.
+        dtype (numpy.dtype): The numeric type of the elements, int (int64)
+        by default.
+        """
+        self.queue = CircularQueue(capacity, dtype=dtype)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __wait(self, condition, predicate, block, deadline):
+        """
+        Waits on a condition until the predicate holds. The lock must be held.
+
+        Parameters:
+        condition (threading.Condition): The condition to wait on.
+        predicate (callable): Returns True once the caller can go on.
+        block (bool): Whether to wait at all.
+        deadline (float): The time.monotonic() value to give up at, or None
+        to wait forever.
+
+        Returns:
+        bool: True if the predicate holds, False if the wait gave up.
+        """
+        while not predicate():
+            if not block:
+                return False
+            if deadline is None:
+                condition.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                condition.wait(remaining)
+        return True
+
+    @staticmethod
+    def __deadline(timeout):
+        """
+        Converts a timeout into a deadline.
+
+        Parameters:
+        timeout (float): The number of seconds to wait, or None.
+
+        Returns:
+        float: The time.monotonic() value to give up at, or None.
+        """
+        if timeout is None:
+            return None
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        return time.monotonic() + timeout
+
+    def qsize(self):
+        """
+        Returns the number of elements in the queue. The value may be out of
+        date as soon as it is returned.
+
+        Returns:
+        int: The number of elements in the queue.
+        """
+        with self.lock:
+            return self.queue.num_elements
+
+    def put(self, value, block=True, timeout=None):
+        """
+        Adds an element to the end of the queue, waiting while it is full.
+
+        Parameters:
+        value: The value to be added to the queue.
+        block (bool): Whether to wait for room. If False, queue.Full is
+        raised right away when the queue is full.
+        timeout (float): The maximum number of seconds to wait, or None to
+        wait as long as needed.
+
+        Raises:
+        queue.Full: If there is still no room when the wait gives up.
+
+        Time Complexity: O(1)
+        """
+        deadline = self.__deadline(timeout)
+        queue = self.queue
+        with self.not_full:
+            if not self.__wait(self.not_full, lambda: queue.num_elements < queue.capacity, block, deadline):
+                raise Full
+            queue.enqueue(value)
+            self.not_empty.notify()
+
+    def put_many(self, array, block=True, timeout=None):
+        """
+        Adds several elements to the end of the queue, in order, waiting for
+        room as needed.
+
+        The elements are added in pieces as room frees up, so an array larger
+        than the capacity can be passed too. Consumers may see the first
+        pieces before the last ones are added.
+
+        Parameters:
+        array (array-like): The values to be added to the queue.
+        block (bool): Whether to wait for room. If False, queue.Full is
+        raised as soon as the queue is full.
+        timeout (float): The maximum number of seconds to wait in total, or
+        None to wait as long as needed.
+
+        Raises:
+        queue.Full: If the wait gives up before every element was added. The
+        elements added until then stay in the queue.
+
+        Time Complexity: O(k), where k is the number of elements.
+        """
+        array = np.asarray(array, dtype=self.queue.values.dtype).ravel()
+        deadline = self.__deadline(timeout)
+        queue = self.queue
+        added = 0
+        with self.not_full:
+            while added < array.size:
+                if not self.__wait(self.not_full, lambda: queue.num_elements < queue.capacity, block, deadline):
+                    raise Full
+                count = min(array.size - added, queue.capacity - queue.num_elements)
+                queue.enqueue_many(array[added:added + count])
+                added += count
+                self.not_empty.notify(count)
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns the element from the front of the queue, waiting
+        while it is empty.
+
+        Parameters:
+        block (bool): Whether to wait for an element. If False, queue.Empty
+        is raised right away when the queue is empty.
+        timeout (float): The maximum number of seconds to wait, or None to
+        wait as long as needed.
+
+        Returns:
+        The first element of the queue.
+
+        Raises:
+        queue.Empty: If there is still no element when the wait gives up.
+
+        Time Complexity: O(1)
+        """
+        deadline = self.__deadline(timeout)
+        queue = self.queue
+        with self.not_empty:
+            if not self.__wait(self.not_empty, lambda: queue.num_elements > 0, block, deadline):
+                raise Empty
+            value = queue.dequeue()
+            self.not_full.notify()
+            return value
+
+    def get_many(self, k, block=True, timeout=None):
+        """
+        Removes and returns up to k elements from the front of the queue,
+        waiting until there is at least one.
+
+        It does not wait for k elements: whatever is in the queue when the
+        first one is available is returned, up to k.
+
+        Parameters:
+        k (int): The maximum number of elements to remove.
+        block (bool): Whether to wait for an element. If False, queue.Empty
+        is raised right away when the queue is empty.
+        timeout (float): The maximum number of seconds to wait, or None to
+        wait as long as needed.
+
+        Returns:
+        np.ndarray: Between 1 and k elements, first in first.
+
+        Raises:
+        queue.Empty: If there is still no element when the wait gives up.
+
+        Time Complexity: O(k)
+        """
+        deadline = self.__deadline(timeout)
+        queue = self.queue
+        with self.not_empty:
+            if not self.__wait(self.not_empty, lambda: queue.num_elements > 0, block, deadline):
+                raise Empty
+            values = queue.dequeue_many(k)
+            self.not_full.notify(values.size)
+            return values
+
+
+class AsyncCircularQueue:
+    """
+    An asyncio facade over a fixed-capacity CircularQueue, for numeric
+    records passed between coroutines.
+
+    Unlike asyncio.Queue, the elements live in a numpy array, so no Python
+    object is kept per element. Coroutines waiting to put or get are
+    suspended on asyncio conditions and woken when the queue changes,
+    without polling. It must be used from a single event loop.
+
+    Attributes:
+    queue (CircularQueue): The queue holding the elements.
+    not_empty (asyncio.Condition): Notified when elements are added.
+    not_full (asyncio.Condition): Notified when elements are removed.
+    batch_ready (asyncio.Condition): Notified, waking every waiter, when
+    elements are added, for get_batch calls waiting for a full batch.
+
+    Methods:
+    qsize(): Returns the number of elements in the queue.
+    put(value): Adds an element, waiting for room.
+    put_many(array): Adds several elements, waiting for room.
+    get(): Removes and returns the first element, waiting for one.
+    get_batch(max_items, timeout): Removes and returns up to max_items elements.
+    """
+
+    def __init__(self, capacity, dtype=int):
+        """
+        Initializes the async queue with a fixed capacity.
+
+        Parameters:
+        capacity (int): The maximum number of elements in the queue.
+        dtype (numpy.dtype): The numeric type of the elements, int (int64)
+        by default.
+        """
+        self.queue = CircularQueue(capacity, dtype=dtype)
+        lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(lock)
+        self.not_full = asyncio.Condition(lock)
+        # Batch waiters have their own condition, so they never take a
+        # wakeup meant for get() and go back to sleep with it
+        self.batch_ready = asyncio.Condition(lock)
+
+    def qsize(self):
+        """
+        Returns the number of elements in the queue.
+
+        Returns:
+        int: The number of elements in the queue.
+        """
+        return self.queue.num_elements
+
+    async def put(self, value):
+        """
+        Adds an element to the end of the queue, waiting while it is full.
+
+        Parameters:
+        value: The value to be added to the queue.
+
+        Time Complexity: O(1)
+        """
+        queue = self.queue
+        async with self.not_full:
+            await self.not_full.wait_for(lambda: queue.num_elements < queue.capacity)
+            queue.enqueue(value)
+            self.not_empty.notify()
+            self.batch_ready.notify_all()
+
+    async def put_many(self, array):
+        """
+        Adds several elements to the end of the queue, in order, waiting for
+        room as needed. An array larger than the capacity is added in pieces.
+
+        Parameters:
+        array (array-like): The values to be added to the queue.
+
+        Time Complexity: O(k), where k is the number of elements.
+        """
+        array = np.asarray(array, dtype=self.queue.values.dtype).ravel()
+        queue = self.queue
+        added = 0
+        async with self.not_full:
+            while added < array.size:
+                await self.not_full.wait_for(lambda: queue.num_elements < queue.capacity)
+                count = min(array.size - added, queue.capacity - queue.num_elements)
+                queue.enqueue_many(array[added:added + count])
+                added += count
+                self.not_empty.notify(count)
+                self.batch_ready.notify_all()
+
+    async def get(self):
+        """
+        Removes and returns the element from the front of the queue, waiting
+        while it is empty.
+
+        Returns:
+        The first element of the queue.
+
+        Time Complexity: O(1)
+        """
+        queue = self.queue
+        async with self.not_empty:
+            await self.not_empty.wait_for(lambda: queue.num_elements > 0)
+            value = queue.dequeue()
+            self.not_full.notify()
+            return value
+
+    async def get_batch(self, max_items, timeout=None):
+        """
+        Removes and returns up to max_items elements from the front of the
+        queue as one numpy array.
+
+        Without a timeout, it waits until there is at least one element and
+        returns whatever is in the queue, up to max_items. With a timeout, it
+        waits up to that many seconds for max_items elements to gather (or
+        for the queue to fill up, if max_items is larger than its capacity)
+        and then returns what arrived, which may be nothing.
+
+        Parameters:
+        max_items (int): The maximum number of elements to remove.
+        timeout (float): The maximum number of seconds to wait for a full
+        batch, or None.
+
+        Returns:
+        np.ndarray: At most max_items elements, first in first.
+
+        Time Complexity: O(k), where k is the number of elements returned.
+        """
+        queue = self.queue
+        async with self.not_empty:
+            if timeout is None:
+                await self.not_empty.wait_for(lambda: queue.num_elements > 0)
+            else:
+                target = min(max_items, queue.capacity)
+                try:
+                    await asyncio.wait_for(
+                        self.batch_ready.wait_for(lambda: queue.num_elements >= target), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            values = queue.dequeue_many(max_items)
+            if values.size > 0:
+                self.not_full.notify(values.size)
+            return values
+
+
+class SharedCircularQueue:
+    """
+    A single-producer/single-consumer circular queue stored in shared memory,
+    for passing numeric records between processes without pickling.
+
+    The elements and two counters live in a multiprocessing.shared_memory
+    block that another process opens by name with attach(). The tail counter
+    is the number of elements ever enqueued and is only written by the
+    producer; the head counter is the number ever dequeued and is only
+    written by the consumer. Both only grow, the position of an element
+    being its counter modulo the capacity, so no lock is needed as long as
+    there is one producer and one consumer. Each counter is an aligned
+    8-byte integer written after the elements it publishes.
+
+    Neither Python nor numpy puts a memory barrier between those writes, so
+    the queue relies on the CPU keeping stores (and loads) in program order
+    across processes. That holds on strongly ordered CPUs such as x86 and
+    x86-64, but not on weakly ordered ones such as ARM or POWER, where the
+    other process may see a counter before the elements it publishes and
+    read stale data. Use a queue with a lock, e.g. multiprocessing.Queue,
+    on those CPUs.
+
+    The calls never block: when the queue is full or empty they add or
+    return fewer elements, and the caller decides how to wait.
+
+    Attributes:
+    shm (shared_memory.SharedMemory): The shared memory block.
+    name (str): The name other processes attach to.
+    capacity (int): The maximum number of elements in the queue.
+    values (np.ndarray): The elements, stored in the shared memory.
+    created_names (set): The names of the queues created by this process.
+
+    Methods:
+    attach(name): Opens a queue created by another process.
+    size(): Returns the number of elements in the queue.
+    enqueue(value): Adds an element to the end of the queue.
+    enqueue_many(array): Adds as many elements as fit.
+    dequeue(): Removes and returns the first element.
+    dequeue_many(k): Removes and returns up to k elements.
+    writable_views(k), commit_write(count): Zero-copy enqueue.
+    readable_views(k), commit_read(count): Zero-copy dequeue.
+    close(): Detaches from the shared memory.
+    unlink(): Frees the shared memory once every process has closed it.
+    """
+
+    created_names = set()
+
+    def __init__(self, capacity, dtype=int, name=None, _shm=None):
+        """
+        Creates a queue in a new shared memory block.
+
+        Parameters:
+        capacity (int): The maximum number of elements in the queue.
+        dtype (numpy.dtype): The numeric type of the elements, int (int64)
+        by default.
+        name (str): The name of the shared memory block, or None to let the
+        system choose one.
+        """
+        if _shm is None:
+            dtype = np.dtype(dtype)
+            _shm = shared_memory.SharedMemory(name=name, create=True,
+                                              size=SHARED_HEADER_SIZE + capacity * dtype.itemsize)
+            header = np.ndarray(1, dtype=SHARED_HEADER, buffer=_shm.buf)
+            header[0] = (SHARED_MAGIC, dtype.str, capacity)
+            SharedCircularQueue.created_names.add(_shm.name)
+            np.ndarray(1, dtype='<i8', buffer=_shm.buf, offset=SHARED_TAIL_OFFSET)[0] = 0
+            np.ndarray(1, dtype='<i8', buffer=_shm.buf, offset=SHARED_HEAD_OFFSET)[0] = 0
+        else:
+            header = np.ndarray(1, dtype=SHARED_HEADER, buffer=_shm.buf)
+            if header['magic'][0] != SHARED_MAGIC:
+                _shm.close()
+                raise ValueError(f'{_shm.name} does not hold a circular queue')
+            dtype = np.dtype(header['dtype'][0].decode())
+            capacity = int(header['capacity'][0])
+
+        self.shm = _shm
+        self.name = _shm.name
+        self.capacity = capacity
+        self.values = np.ndarray(capacity, dtype=dtype, buffer=_shm.buf, offset=SHARED_HEADER_SIZE)
+        self.__tail = np.ndarray(1, dtype='<i8', buffer=_shm.buf, offset=SHARED_TAIL_OFFSET)
+        self.__head = np.ndarray(1, dtype='<i8', buffer=_shm.buf, offset=SHARED_HEAD_OFFSET)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Opens a queue created by another process, or another handle to a
+        queue created by this one. The capacity and dtype are read from the
+        shared memory.
+
+        Parameters:
+        name (str): The name of the queue, as given by its name attribute.
+
+        Returns:
+        SharedCircularQueue: The attached queue.
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # Before Python 3.13 attaching registers the block with the
+            # resource tracker, which would free it when this process exits.
+            # The creator and its child processes share one tracker, where
+            # the block is already registered, so only unrelated processes
+            # undo the registration
+            if multiprocessing.parent_process() is None and name not in cls.created_names:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(0, _shm=shm)
+
+    def size(self):
+        """
+        Returns the number of elements in the queue.
+
+        Returns:
+        int: The number of elements in the queue.
+
+        Time Complexity: O(1)
+        """
+        return int(self.__tail[0] - self.__head[0])
+
+    def __segments(self, counter, count):
+        """
+        Returns the views over count positions starting at a counter value,
+        split where they wrap around the end of the array.
+
+        Parameters:
+        counter (int): The head or tail counter value to start at.
+        count (int): The number of positions.
+
+        Returns:
+        tuple: One or two views into the shared memory.
+        """
+        position = counter % self.capacity
+        first_part = min(count, self.capacity - position)
+        if first_part == count:
+            return (self.values[position:position + count],)
+        return (self.values[position:], self.values[:count - first_part])
+
+    def writable_views(self, k):
+        """
+        Returns views over the free positions at the end of the queue, for
+        the producer to fill in place. The elements are only published by
+        commit_write.
+
+        Parameters:
+        k (int): The maximum number of positions wanted.
+
+        Returns:
+        tuple: One or two views, holding min(k, free positions) positions
+        in total (empty if the queue is full).
+
+        Time Complexity: O(1)
+        """
+        tail = int(self.__tail[0])
+        count = min(k, self.capacity - (tail - int(self.__head[0])))
+        return self.__segments(tail, max(count, 0))
+
+    def commit_write(self, count):
+        """
+        Publishes the first count positions filled through writable_views.
+
+        Parameters:
+        count (int): The number of elements written.
+
+        Time Complexity: O(1)
+        """
+        self.__tail[0] += count
+
+    def readable_views(self, k):
+        """
+        Returns views over the first elements of the queue, for the consumer
+        to read in place. The elements are only released by commit_read, so
+        the producer cannot overwrite them while they are being read.
+
+        Parameters:
+        k (int): The maximum number of elements wanted.
+
+        Returns:
+        tuple: One or two views, holding min(k, size) elements in total.
+
+        Time Complexity: O(1)
+        """
+        head = int(self.__head[0])
+        count = min(k, int(self.__tail[0]) - head)
+        return self.__segments(head, max(count, 0))
+
+    def commit_read(self, count):
+        """
+        Releases the first count elements read through readable_views.
+
+        Parameters:
+        count (int): The number of elements read.
+
+        Time Complexity: O(1)
+        """
+        self.__head[0] += count
+
+    def enqueue(self, value):
+        """
+        Adds an element to the end of the queue.
+
+        Parameters:
+        value: The value to be added to the queue.
+
+        Returns:
+        bool: True if the element was added, False if the queue is full.
+
+        Time Complexity: O(1)
+        """
+        tail = int(self.__tail[0])
+        if tail - int(self.__head[0]) == self.capacity:
+            return False
+        self.values[tail % self.capacity] = value
+        self.__tail[0] = tail + 1
+        return True
+
+    def enqueue_many(self, array):
+        """
+        Adds as many elements as fit to the end of the queue, in order,
+        copying them straight into the shared memory in at most two slices.
+
+        Parameters:
+        array (array-like): The values to be added to the queue.
+
+        Returns:
+        int: The number of elements added, from the start of the array.
+
+        Time Complexity: O(k), where k is the number of elements added.
+        """
+        array = np.asarray(array, dtype=self.values.dtype).ravel()
+        added = 0
+        for view in self.writable_views(array.size):
+            view[:] = array[added:added + view.size]
+            added += view.size
+        self.commit_write(added)
+        return added
+
+    def dequeue(self):
+        """
+        Removes and returns the element from the front of the queue.
+
+        Returns:
+        The first element, or None if the queue is empty.
+
+        Time Complexity: O(1)
+        """
+        head = int(self.__head[0])
+        if head == int(self.__tail[0]):
+            return None
+        value = self.values[head % self.capacity]
+        self.__head[0] = head + 1
+        return value
+
+    def dequeue_many(self, k):
+        """
+        Removes and returns up to k elements from the front of the queue,
+        copied out of the shared memory.
+
+        Parameters:
+        k (int): The maximum number of elements to remove.
+
+        Returns:
+        np.ndarray: The removed elements, first in first. It is empty if the
+        queue is empty.
+
+        Time Complexity: O(k)
+        """
+        views = self.readable_views(k)
+        values = np.concatenate(views) if len(views) > 1 else views[0].copy()
+        self.commit_read(values.size)
+        return values
+
+    def close(self):
+        """
+        Detaches this process from the shared memory. Views returned by the
+        queue must be released first.
+        """
+        self.values = self.__tail = self.__head = None
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Frees the shared memory. It should be called once, by the process
+        that created the queue, after every process is done with it.
+        """
+        self.shm.unlink()
+        SharedCircularQueue.created_names.discard(self.name)
+
+
+if __name__ == '__main__':
+    # Test
+
+    queue = CircularQueue(5)
+    queue.enqueue(1)
+    queue.enqueue(2)
+    queue.enqueue(3)
+    queue.enqueue(4)
+    queue.enqueue(5)
+    queue.dequeue()  # Removes 1
+    queue.dequeue()  # Removes 2
+    queue.enqueue(6)
+    queue.enqueue(7)
+
+    # Display the current state of the queue
+    queue.display()
+
+    # A full queue raises instead of printing
+    try:
+        queue.enqueue(8)
+    except QueueFullError as error:
+        print(error)  # The queue is full
+
+    # Growable capacity: the wrapped elements keep their order
+    queue.reserve(8)
+    queue.enqueue(8)
+    queue.display()
+
+    # Diagnostics through the trace hook
+    traced = CircularQueue(3, trace=lambda operation, queue: print(operation, queue.to_array()))
+    traced.enqueue(1)  # enqueue [1]
+    traced.dequeue()  # dequeue []
+
+    # Floating-point timestamps
+    timestamps = CircularQueue(3, dtype=np.float64)
+    timestamps.enqueue(1.5)
+    timestamps.enqueue(2.25)
+    print(timestamps.dequeue(), timestamps.first())  # 1.5 2.25
+
+    # Batch operations, wrapping around the end of the array
+    batch = CircularQueue(5)
+    batch.enqueue_many([1, 2, 3, 4])
+    print(batch.dequeue_many(3))  # [1 2 3]
+    batch.enqueue_many([5, 6, 7])
+    print(batch.dequeue_many(10))  # [4 5 6 7]
+
+    # Thread-safe producer/consumer: the producer blocks while the queue is full
+    pipeline = BlockingCircularQueue(4)
+    producer = threading.Thread(target=pipeline.put_many, args=(np.arange(10),))
+    producer.start()
+    received = []
+    while sum(len(values) for values in received) < 10:
+        received.append(pipeline.get_many(3))
+    producer.join()
+    print(np.concatenate(received))  # [0 1 2 3 4 5 6 7 8 9]
+    try:
+        pipeline.get(timeout=0.01)
+    except Empty:
+        print('The queue is empty')
+
+    # Coroutines: the consumer collects the records in batches
+    async def produce_and_consume():
+        records = AsyncCircularQueue(4)
+        producer = asyncio.create_task(records.put_many(np.arange(6)))
+        first = await records.get_batch(4)
+        rest = await records.get_batch(4, timeout=0.01)
+        await producer
+        return first, rest
+
+    print(*asyncio.run(produce_and_consume()))  # [0 1 2 3] [4 5]
+
+    # Shared memory: a second handle attached by name sees the same elements
+    shared = SharedCircularQueue(4)
+    other = SharedCircularQueue.attach(shared.name)
+    print(shared.enqueue_many([1, 2, 3, 4, 5]))  # 4, the queue is full
+    print(other.dequeue_many(3), other.size())  # [1 2 3] 1
+    other.close()
+    shared.close()
+    shared.unlink()
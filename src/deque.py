@@ -6,24 +6,59 @@
 
 import numpy as np
 
-class Deque:
+from growable_array import GrowableArray
+
+# Below this many samples, SlidingWindowAggregator.push_many pushes the
+# samples one at a time instead of running the vectorized algorithm
+VECTORIZED_BATCH_SIZE = 64
+
+
+class DequeFullError(Exception):
+    """
+    Raised when an element is added to a full deque that cannot grow.
+    """
+
+
+class DequeEmptyError(IndexError):
+    """
+    Raised when an element is removed from an empty deque. Like
+    collections.deque, it is an IndexError.
+    """
+
+
+class Deque(GrowableArray):
     """
     A double-ended queue (Deque) implementation where elements can be 
     added or removed from both ends.
     """
 
-    def __init__(self, capacity):
+    def __init__(self, capacity, dtype=int, growth_factor=None, shrink_threshold=None, trace=None):
         """
         Initializes the deque with a given capacity.
 
         Args:
-            capacity (int): Maximum number of elements the deque can hold.
+            capacity (int): Initial number of elements the deque can hold.
+            dtype (numpy.dtype): Numeric type of the elements, int (int64)
+                by default. Smaller types such as np.int32 or np.uint16 save
+                memory.
+            growth_factor (float): Factor the capacity grows by when the
+                deque is full, or None for a fixed capacity (see
+                GrowableArray).
+            shrink_threshold (float): Fraction of the capacity below which
+                the deque shrinks after a removal, or None to never shrink.
+            trace (callable): A diagnostics hook, called as
+                trace(operation, deque) after each insertion or removal,
+                e.g. trace=lambda operation, deque: deque.display_deque().
+                The default None costs a single check per operation.
         """
+        super().__init__(capacity, growth_factor, shrink_threshold)
+
         self.capacity = capacity
         self.start = -1
         self.end = 0
         self.number_of_elements = 0
-        self.values = np.empty(self.capacity, dtype=int)
+        self.values = np.empty(self.capacity, dtype=dtype)
+        self.trace = trace
 
     def __is_full(self):
         """
@@ -32,7 +67,31 @@ class Deque:
         Returns:
             bool: True if the deque is full, False otherwise.
         """
-        return (self.start == 0 and self.end == self.capacity - 1) or (self.start == self.end + 1)
+        return self.number_of_elements == self.capacity
+
+    def _resize(self, capacity):
+        """
+        Moves the elements to a new array with the given capacity.
+
+        The elements are copied from start to end, unwrapping the ring, so
+        the front element ends up at index 0.
+
+        Args:
+            capacity (int): The new capacity of the deque.
+        """
+        values = np.empty(capacity, dtype=self.values.dtype)
+        count = self.number_of_elements
+        if count > 0:
+            # At most two segments: from start to the end of the array, then
+            # the part that wrapped around to the beginning
+            first_part = min(count, self.capacity - self.start)
+            values[:first_part] = self.values[self.start:self.start + first_part]
+            values[first_part:count] = self.values[:count - first_part]
+            self.start = 0
+            self.end = count - 1
+
+        self.values = values
+        self.capacity = capacity
 
     def __is_empty(self):
         """
@@ -50,11 +109,11 @@ class Deque:
         Args:
             value (int): The value to be added to the front of the deque.
 
-        If the deque is full, a message is printed.
+        Raises:
+            DequeFullError: If the deque is full and cannot grow.
         """
-        if self.__is_full():
-            print('The deque is full')
-            return
+        if self.__is_full() and not self._ensure_capacity(self.number_of_elements + 1):
+            raise DequeFullError('The deque is full')
 
         # If deque is empty
         if self.start == -1:
@@ -67,7 +126,9 @@ class Deque:
             self.start -= 1
 
         self.values[self.start] = value
-        self.display_deque()
+        self.number_of_elements += 1
+        if self.trace is not None:
+            self.trace('insert_start', self)
 
     def insert_end(self, value):
         """
@@ -76,11 +137,11 @@ class Deque:
         Args:
             value (int): The value to be added to the end of the deque.
 
-        If the deque is full, a message is printed.
+        Raises:
+            DequeFullError: If the deque is full and cannot grow.
         """
-        if self.__is_full():
-            print('The deque is full')
-            return
+        if self.__is_full() and not self._ensure_capacity(self.number_of_elements + 1):
+            raise DequeFullError('The deque is full')
 
         # If deque is empty
         if self.start == -1:
@@ -93,18 +154,24 @@ class Deque:
             self.end += 1
 
         self.values[self.end] = value
-        self.display_deque()
+        self.number_of_elements += 1
+        if self.trace is not None:
+            self.trace('insert_end', self)
 
-    def remove_start(self):
+    def pop_left(self):
         """
         Removes and returns the element from the front of the deque.
 
-        If the deque is empty, a message is printed.
+        Returns:
+            int: The front element.
+
+        Raises:
+            DequeEmptyError: If the deque is empty.
         """
         if self.__is_empty():
-            print('The deque is already empty')
-            return
+            raise DequeEmptyError('The deque is already empty')
 
+        value = self.values[self.start]
         # If there is only one element
         if self.start == self.end:
             self.start = -1
@@ -115,26 +182,219 @@ class Deque:
                 self.start = 0
             else:
                 self.start += 1
-        self.display_deque()
+        self.number_of_elements -= 1
+        self._shrink_if_sparse(self.number_of_elements)
+        if self.trace is not None:
+            self.trace('pop_left', self)
+        return value
 
-    def remove_end(self):
+    def pop_right(self):
         """
         Removes and returns the element from the end of the deque.
 
-        If the deque is empty, a message is printed.
+        Returns:
+            int: The end element.
+
+        Raises:
+            DequeEmptyError: If the deque is empty.
         """
         if self.__is_empty():
-            print('The deque is already empty')
-            return
+            raise DequeEmptyError('The deque is already empty')
 
+        value = self.values[self.end]
         if self.start == self.end:
             self.start = -1
             self.end = -1
-        elif self.start == 0:
+        elif self.end == 0:
             self.end = self.capacity - 1
         else:
             self.end -= 1
-        self.display_deque()
+        self.number_of_elements -= 1
+        self._shrink_if_sparse(self.number_of_elements)
+        if self.trace is not None:
+            self.trace('pop_right', self)
+        return value
+
+    def remove_start(self):
+        """
+        Removes the element from the front of the deque. Use pop_left() to
+        get its value as well.
+
+        Raises:
+            DequeEmptyError: If the deque is empty.
+        """
+        self.pop_left()
+
+    def remove_end(self):
+        """
+        Removes the element from the end of the deque. Use pop_right() to get
+        its value as well.
+
+        Raises:
+            DequeEmptyError: If the deque is empty.
+        """
+        self.pop_right()
+
+    def __ring_slices(self, position, count):
+        """
+        Splits count consecutive positions of the ring, starting at the given
+        index, where they wrap around the end of the array.
+
+        Args:
+            position (int): The index of the first position.
+            count (int): The number of positions.
+
+        Returns:
+            list: One or two slices of the array.
+        """
+        first_part = min(count, self.capacity - position)
+        if first_part == count:
+            return [slice(position, position + count)]
+        return [slice(position, self.capacity), slice(0, count - first_part)]
+
+    def __write(self, position, array):
+        """
+        Copies an array into the ring, starting at the given index, in at
+        most two slice copies.
+
+        Args:
+            position (int): The index the first element is written to.
+            array (np.ndarray): The elements to write.
+        """
+        written = 0
+        for ring_slice in self.__ring_slices(position, array.size):
+            count = ring_slice.stop - ring_slice.start
+            self.values[ring_slice] = array[written:written + count]
+            written += count
+
+    def __read(self, position, count):
+        """
+        Copies count elements out of the ring, starting at the given index,
+        in at most two slice copies.
+
+        Args:
+            position (int): The index of the first element.
+            count (int): The number of elements.
+
+        Returns:
+            np.ndarray: A copy of the elements.
+        """
+        slices = self.__ring_slices(position, count)
+        if len(slices) == 1:
+            return self.values[slices[0]].copy()
+        return np.concatenate([self.values[ring_slice] for ring_slice in slices])
+
+    def extend_right(self, array):
+        """
+        Adds several elements to the end of the deque, in order, with at most
+        two slice copies.
+
+        Args:
+            array (array-like): The values to be added to the end.
+
+        Raises:
+            DequeFullError: If the elements do not fit and the deque cannot
+                grow. None of them are added then.
+        """
+        array = np.asarray(array, dtype=self.values.dtype).ravel()
+        count = array.size
+        if count == 0:
+            return
+        if not self._ensure_capacity(self.number_of_elements + count):
+            raise DequeFullError('The deque is full')
+
+        if self.__is_empty():
+            self.start = 0
+            position = 0
+        else:
+            position = (self.end + 1) % self.capacity
+        self.__write(position, array)
+        self.end = (position + count - 1) % self.capacity
+        self.number_of_elements += count
+        if self.trace is not None:
+            self.trace('extend_right', self)
+
+    def extend_left(self, array):
+        """
+        Adds several elements to the front of the deque with at most two
+        slice copies. As with collections.deque.extendleft, each element is
+        added in front of the previous one, so the last element of the array
+        ends up at the front.
+
+        Args:
+            array (array-like): The values to be added to the front.
+
+        Raises:
+            DequeFullError: If the elements do not fit and the deque cannot
+                grow. None of them are added then.
+        """
+        array = np.asarray(array, dtype=self.values.dtype).ravel()
+        count = array.size
+        if count == 0:
+            return
+        if not self._ensure_capacity(self.number_of_elements + count):
+            raise DequeFullError('The deque is full')
+
+        if self.__is_empty():
+            self.start = 0
+            self.end = count - 1
+        else:
+            self.start = (self.start - count) % self.capacity
+        self.__write(self.start, array[::-1])
+        self.number_of_elements += count
+        if self.trace is not None:
+            self.trace('extend_left', self)
+
+    def rotate(self, k=1):
+        """
+        Rotates the deque k steps to the right, moving the last k elements to
+        the front, like collections.deque.rotate. A negative k rotates to the
+        left.
+
+        Only the elements that change ends are moved, in the shorter
+        direction: min(k, n - k) of them, with at most two slice copies in
+        and out of a temporary array. A full deque only moves its pointers.
+
+        Args:
+            k (int): The number of steps to rotate to the right.
+        """
+        count = self.number_of_elements
+        if count == 0:
+            return
+        k %= count
+        if k == 0:
+            return
+
+        if count == self.capacity:
+            self.start = (self.start - k) % self.capacity
+            self.end = (self.end - k) % self.capacity
+        elif k <= count // 2:
+            # The last k elements go right before the first one
+            moved = self.__read((self.end - k + 1) % self.capacity, k)
+            self.start = (self.start - k) % self.capacity
+            self.end = (self.end - k) % self.capacity
+            self.__write(self.start, moved)
+        else:
+            # Rotating left by count - k moves fewer elements: the first
+            # ones go right after the last one
+            k = count - k
+            moved = self.__read(self.start, k)
+            position = (self.end + 1) % self.capacity
+            self.start = (self.start + k) % self.capacity
+            self.end = (self.end + k) % self.capacity
+            self.__write(position, moved)
+        if self.trace is not None:
+            self.trace('rotate', self)
+
+    def clear(self):
+        """
+        Removes all the elements of the deque, keeping its capacity.
+        """
+        self.start = -1
+        self.end = 0
+        self.number_of_elements = 0
+        if self.trace is not None:
+            self.trace('clear', self)
 
     def get_start(self):
         """
@@ -144,7 +404,6 @@ class Deque:
             int: The front element, or None if the deque is empty.
         """
         if self.__is_empty():
-            print('The deque is already empty')
             return None
 
         return self.values[self.start]
@@ -157,11 +416,60 @@ class Deque:
             int: The end element, or None if the deque is empty.
         """
         if self.__is_empty() or self.end < 0:
-            print('The deque is already empty')
             return None
 
         return self.values[self.end]
 
+    def as_views(self):
+        """
+        Returns the elements of the deque, from start to end, as read-only
+        views into its array, without copying anything.
+
+        The views are only valid until the deque changes: a later insertion
+        may overwrite them, and a resize moves the elements to a new array.
+
+        Returns:
+            tuple: One view, or two when the elements wrap around the end of
+                the array: from start to the end of the array, then from the
+                beginning.
+        """
+        count = self.number_of_elements
+        start = max(self.start, 0)
+        first_part = min(count, self.capacity - start)
+        views = (self.values[start:start + first_part],)
+        if first_part < count:
+            views += (self.values[:count - first_part],)
+        for view in views:
+            view.flags.writeable = False
+        return views
+
+    def to_array(self, out=None):
+        """
+        Copies the elements of the deque, from start to end, into an array.
+
+        Args:
+            out (np.ndarray): A preallocated array to fill, holding at least
+                as many elements as the deque, or None to allocate a new one.
+
+        Returns:
+            np.ndarray: The elements from start to end. When out is given, it
+                is the start of out that was filled.
+
+        Raises:
+            ValueError: If out is too small.
+        """
+        count = self.number_of_elements
+        if out is None:
+            out = np.empty(count, dtype=self.values.dtype)
+        elif len(out) < count:
+            raise ValueError(f'out holds {len(out)} elements, the deque {count}')
+
+        position = 0
+        for view in self.as_views():
+            out[position:position + view.size] = view
+            position += view.size
+        return out[:count]
+
     def display_deque(self):
         """
         Prints the current state of the deque.
@@ -169,26 +477,611 @@ class Deque:
         if self.__is_empty():
             print("Deque is empty")
         else:
-            # Print elements from start to end
-            if self.end >= self.start:
-                print("Deque:", self.values[self.start:self.end + 1])
-            else:
-                print("Deque:", np.concatenate((self.values[self.start:], 
-                self.values[:self.end + 1])))
+            print("Deque:", self.to_array())
+
+
+class SlidingWindowAggregator:
+    """
+    Rolling minimum, maximum, sum and mean over the last `window` samples of
+    a stream, in amortized O(1) per sample instead of rescanning the window.
+
+    The samples in the window are kept in a Deque, with a running sum. The
+    minimum and the maximum come from monotonic deques: the positions and
+    values of the samples that can still become the minimum (or maximum) of
+    a later window, in increasing (or decreasing) order, so the answer is
+    always at the front.
+    """
+
+    def __init__(self, window, dtype=np.float64):
+        """
+        Initializes an empty aggregator.
+
+        Args:
+            window (int): Number of most recent samples aggregated.
+            dtype (numpy.dtype): Numeric type of the samples, np.float64 by
+                default. Booleans, integers and floats are supported.
+
+        Raises:
+            ValueError: If window is smaller than 1 or dtype is not a
+                boolean, integer or floating-point type.
+        """
+        if window < 1:
+            raise ValueError("'window' must be at least 1")
+        self.window = window
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind not in 'biuf':
+            raise ValueError("'dtype' must be a boolean, integer or floating-point type")
+        # Integer sums are exact in int64; floating-point sums use float64
+        self.sum_dtype = np.dtype(np.int64 if self.dtype.kind in 'biu' else np.float64)
+        self.count = 0
+        self.total = self.sum_dtype.type(0)
+        self.samples = Deque(window, dtype=self.dtype)
+        self.min_positions = Deque(window, dtype=np.int64)
+        self.min_values = Deque(window, dtype=self.dtype)
+        self.max_positions = Deque(window, dtype=np.int64)
+        self.max_values = Deque(window, dtype=self.dtype)
+
+    def push(self, value):
+        """
+        Adds a sample to the window, dropping the oldest one if the window
+        is full.
+
+        Args:
+            value (int or float): The new sample.
+        """
+        value = self.dtype.type(value)
+        if self.samples.number_of_elements == self.window:
+            self.total -= self.samples.pop_left()
+        self.samples.insert_end(value)
+        self.total += value
+
+        # Drop the front if it slides out of the window
+        oldest = self.count + 1 - self.window
+        if self.min_positions.number_of_elements > 0 and self.min_positions.get_start() < oldest:
+            self.min_positions.pop_left()
+            self.min_values.pop_left()
+        if self.max_positions.number_of_elements > 0 and self.max_positions.get_start() < oldest:
+            self.max_positions.pop_left()
+            self.max_values.pop_left()
+
+        # Samples that are not smaller (larger) than the new one can never
+        # be the minimum (maximum) again
+        while self.min_values.number_of_elements > 0 and self.min_values.get_end() >= value:
+            self.min_values.pop_right()
+            self.min_positions.pop_right()
+        while self.max_values.number_of_elements > 0 and self.max_values.get_end() <= value:
+            self.max_values.pop_right()
+            self.max_positions.pop_right()
+        self.min_positions.insert_end(self.count)
+        self.min_values.insert_end(value)
+        self.max_positions.insert_end(self.count)
+        self.max_values.insert_end(value)
+        self.count += 1
+
+    def minimum(self):
+        """
+        Returns:
+            The smallest sample in the window, or None if there is none.
+        """
+        return self.min_values.get_start()
+
+    def maximum(self):
+        """
+        Returns:
+            The largest sample in the window, or None if there is none.
+        """
+        return self.max_values.get_start()
+
+    def sum(self):
+        """
+        Returns:
+            The sum of the samples in the window.
+        """
+        return self.total
+
+    def mean(self):
+        """
+        Returns:
+            float: The mean of the samples in the window, or None if there is
+                none.
+        """
+        if self.samples.number_of_elements == 0:
+            return None
+        return self.total / self.samples.number_of_elements
+
+    def __result(self, size):
+        """
+        Allocates the structured array returned by push_many.
+
+        Args:
+            size (int): Number of positions.
+
+        Returns:
+            np.ndarray: An uninitialized array with min, max, sum and mean
+                fields.
+        """
+        return np.empty(size, dtype=[('min', self.dtype), ('max', self.dtype),
+                                     ('sum', self.sum_dtype), ('mean', np.float64)])
+
+    def push_many(self, array):
+        """
+        Adds several samples and returns the aggregates of the window ending
+        at each of them.
+
+        Small batches go through push() one sample at a time. Larger ones are
+        vectorized: the minima and maxima use the van Herk/Gil-Werman
+        algorithm (prefix and suffix extrema of blocks of `window` samples,
+        about three comparisons per sample whatever the window), the sums
+        use a cumulative sum, and the deques are then rebuilt from the last
+        `window` samples.
+
+        Args:
+            array (array-like): The new samples, oldest first.
+
+        Returns:
+            np.ndarray: A structured array with the min, max, sum and mean of
+                the window after each new sample.
+        """
+        array = np.asarray(array, dtype=self.dtype).ravel()
+        result = self.__result(array.size)
+        if array.size < VECTORIZED_BATCH_SIZE:
+            for i, value in enumerate(array):
+                self.push(value)
+                result[i] = (self.minimum(), self.maximum(), self.total, self.mean())
+            return result
+
+        window = self.window
+        # The previous samples still in the window of the first new one
+        history = self.samples.to_array()[-(window - 1):] if window > 1 else array[:0]
+        padding = window - 1 - history.size
+        samples = np.concatenate((history, array))
+
+        result['min'] = self.__sliding_extremum(samples, padding, np.minimum)
+        result['max'] = self.__sliding_extremum(samples, padding, np.maximum)
+
+        sums = np.concatenate(([0], np.cumsum(samples, dtype=self.sum_dtype)))
+        ends = np.arange(history.size + 1, samples.size + 1)
+        starts = np.maximum(ends - window, 0)
+        result['sum'] = sums[ends] - sums[starts]
+        result['mean'] = result['sum'] / (ends - starts)
+
+        self.count += array.size
+        self.__resync(samples[-window:])
+        return result
+
+    def __sliding_extremum(self, samples, padding, ufunc):
+        """
+        Computes the minimum or maximum of every window of the samples with
+        the van Herk/Gil-Werman algorithm.
+
+        Args:
+            samples (np.ndarray): The samples, where the first window - 1
+                only complete the windows of the others.
+            padding (int): Number of missing samples before the first one,
+                for windows that would start before the stream.
+            ufunc (numpy.ufunc): np.minimum or np.maximum.
+
+        Returns:
+            np.ndarray: The extremum of the window ending at each sample
+                after the first window - 1 - padding ones.
+        """
+        window = self.window
+        # Identity of the ufunc, so padding never wins a comparison
+        if self.dtype.kind == 'f':
+            identity = np.inf if ufunc is np.minimum else -np.inf
+        elif self.dtype.kind == 'b':
+            identity = ufunc is np.minimum
+        else:
+            info = np.iinfo(self.dtype)
+            identity = info.max if ufunc is np.minimum else info.min
+
+        size = padding + samples.size
+        blocks = -(-size // window)
+        padded = np.full(blocks * window, identity, dtype=self.dtype)
+        padded[padding:size] = samples
+        padded = padded.reshape(blocks, window)
+
+        # Extremum from the start of each block, and up to the end of it
+        prefix = ufunc.accumulate(padded, axis=1).ravel()
+        suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+
+        # A window starting at i spans the end of one block and the start
+        # of the next
+        starts = np.arange(size - window + 1)
+        return ufunc(suffix[starts], prefix[starts + window - 1])
+
+    def __resync(self, samples):
+        """
+        Rebuilds the window, running sum and monotonic deques from the last
+        samples of the stream, after a vectorized push_many.
+
+        Args:
+            samples (np.ndarray): The last min(window, count) samples, oldest
+                first, including the new ones.
+        """
+        positions = np.arange(self.count - samples.size, self.count)
+
+        self.samples.clear()
+        self.samples.extend_right(samples)
+        self.total = np.sum(samples, dtype=self.sum_dtype)
+
+        # A sample stays in the minimum deque if it is smaller than every
+        # later sample in the window (larger, for the maximum deque)
+        later_min = np.minimum.accumulate(samples[::-1])[::-1]
+        later_max = np.maximum.accumulate(samples[::-1])[::-1]
+        keep_min = np.ones(samples.size, dtype=bool)
+        keep_min[:-1] = samples[:-1] < later_min[1:]
+        keep_max = np.ones(samples.size, dtype=bool)
+        keep_max[:-1] = samples[:-1] > later_max[1:]
+
+        for positions_deque, values_deque, keep in ((self.min_positions, self.min_values, keep_min),
+                                                     (self.max_positions, self.max_values, keep_max)):
+            positions_deque.clear()
+            positions_deque.extend_right(positions[keep])
+            values_deque.clear()
+            values_deque.extend_right(samples[keep])
+
+
+class Block:
+    """
+    A fixed-size block of elements in a BlockDeque, linked to its neighbours.
+    """
+
+    def __init__(self, size, dtype):
+        self.values = np.empty(size, dtype=dtype)  # The elements of the block
+        self.next = None  # Pointer to the next block
+        self.prev = None  # Pointer to the previous block
+
+
+class BlockDeque:
+    """
+    An unbounded double-ended queue stored as a doubly linked list of
+    fixed-size numpy blocks, like CPython's collections.deque but with typed
+    storage.
+
+    Adding an element at either end writes into the first or last block and
+    links a new block when that one is full, so the deque never copies its
+    elements to grow. Blocks are unlinked as soon as they are emptied, so
+    the memory is given back block by block as the deque drains. One spare
+    block is kept to avoid allocating again when the deque goes back and
+    forth across a block boundary.
+
+    The elements are first.values[start:] through last.values[:end + 1].
+    """
+
+    def __init__(self, block_size=1024, dtype=int, trace=None):
+        """
+        Initializes an empty deque with a single block.
+
+        Args:
+            block_size (int): Number of elements per block, at least 2.
+            dtype (numpy.dtype): Numeric type of the elements, int (int64)
+                by default.
+            trace (callable): A diagnostics hook, called as
+                trace(operation, deque) after each insertion or removal. The
+                default None costs a single check per operation.
+        """
+        # An empty deque sits in the middle of its block, which needs room
+        # on both sides
+        if block_size < 2:
+            raise ValueError("'block_size' must be at least 2")
+        self.block_size = block_size
+        self.dtype = np.dtype(dtype)
+        self.first = self.last = Block(block_size, self.dtype)
+        self.number_of_blocks = 1
+        self.spare = None
+        self.number_of_elements = 0
+        self.trace = trace
+        self.__center()
+
+    def __center(self):
+        """
+        Places the (empty) deque in the middle of its block, so it can grow
+        towards both ends before linking a new block.
+        """
+        self.start = self.block_size // 2
+        self.end = self.start - 1
+
+    def __new_block(self):
+        """
+        Returns a block to link, reusing the spare one if there is one.
+
+        Returns:
+            Block: An unlinked block.
+        """
+        self.number_of_blocks += 1
+        if self.spare is not None:
+            block, self.spare = self.spare, None
+            return block
+        return Block(self.block_size, self.dtype)
+
+    def __release(self, block):
+        """
+        Takes an unlinked block out of the deque, keeping it as the spare
+        block if there is none, so that otherwise its memory is freed.
+
+        Args:
+            block (Block): The block that was unlinked.
+        """
+        self.number_of_blocks -= 1
+        block.next = block.prev = None
+        if self.spare is None:
+            self.spare = block
+
+    def __append_block(self):
+        """
+        Links a new block after the last one.
+        """
+        block = self.__new_block()
+        block.prev = self.last
+        self.last.next = block
+        self.last = block
+        self.end = -1
+
+    def __prepend_block(self):
+        """
+        Links a new block before the first one.
+        """
+        block = self.__new_block()
+        block.next = self.first
+        self.first.prev = block
+        self.first = block
+        self.start = self.block_size
+
+    def insert_end(self, value):
+        """
+        Adds an element to the end of the deque.
+
+        Args:
+            value (int): The value to be added to the end of the deque.
+        """
+        if self.end == self.block_size - 1:
+            self.__append_block()
+        self.end += 1
+        self.last.values[self.end] = value
+        self.number_of_elements += 1
+        if self.trace is not None:
+            self.trace('insert_end', self)
+
+    def insert_start(self, value):
+        """
+        Adds an element to the front of the deque.
+
+        Args:
+            value (int): The value to be added to the front of the deque.
+        """
+        if self.start == 0:
+            self.__prepend_block()
+        self.start -= 1
+        self.first.values[self.start] = value
+        self.number_of_elements += 1
+        if self.trace is not None:
+            self.trace('insert_start', self)
+
+    def extend_right(self, array):
+        """
+        Adds several elements to the end of the deque, in order, with one
+        slice copy per block filled.
+
+        Args:
+            array (array-like): The values to be added to the end.
+        """
+        array = np.asarray(array, dtype=self.dtype).ravel()
+        written = 0
+        while written < array.size:
+            if self.end == self.block_size - 1:
+                self.__append_block()
+            count = min(array.size - written, self.block_size - 1 - self.end)
+            self.last.values[self.end + 1:self.end + 1 + count] = array[written:written + count]
+            self.end += count
+            written += count
+        self.number_of_elements += array.size
+        if self.trace is not None:
+            self.trace('extend_right', self)
+
+    def extend_left(self, array):
+        """
+        Adds several elements to the front of the deque, with one slice copy
+        per block filled. As with collections.deque.extendleft, the last
+        element of the array ends up at the front.
+
+        Args:
+            array (array-like): The values to be added to the front.
+        """
+        array = np.asarray(array, dtype=self.dtype).ravel()
+        written = 0
+        while written < array.size:
+            if self.start == 0:
+                self.__prepend_block()
+            count = min(array.size - written, self.start)
+            # The next elements of the array go right before the front, in
+            # reverse order
+            self.first.values[self.start - count:self.start] = array[written:written + count][::-1]
+            self.start -= count
+            written += count
+        self.number_of_elements += array.size
+        if self.trace is not None:
+            self.trace('extend_left', self)
+
+    def pop_left(self):
+        """
+        Removes and returns the element from the front of the deque, freeing
+        the first block when it becomes empty.
+
+        Returns:
+            int: The front element.
+
+        Raises:
+            DequeEmptyError: If the deque is empty.
+        """
+        if self.number_of_elements == 0:
+            raise DequeEmptyError('The deque is already empty')
+
+        value = self.first.values[self.start]
+        self.start += 1
+        self.number_of_elements -= 1
+        if self.number_of_elements == 0:
+            self.__center()
+        elif self.start == self.block_size:
+            block = self.first
+            self.first = block.next
+            self.first.prev = None
+            self.__release(block)
+            self.start = 0
+        if self.trace is not None:
+            self.trace('pop_left', self)
+        return value
+
+    def pop_right(self):
+        """
+        Removes and returns the element from the end of the deque, freeing
+        the last block when it becomes empty.
+
+        Returns:
+            int: The end element.
+
+        Raises:
+            DequeEmptyError: If the deque is empty.
+        """
+        if self.number_of_elements == 0:
+            raise DequeEmptyError('The deque is already empty')
+
+        value = self.last.values[self.end]
+        self.end -= 1
+        self.number_of_elements -= 1
+        if self.number_of_elements == 0:
+            self.__center()
+        elif self.end == -1:
+            block = self.last
+            self.last = block.prev
+            self.last.next = None
+            self.__release(block)
+            self.end = self.block_size - 1
+        if self.trace is not None:
+            self.trace('pop_right', self)
+        return value
+
+    def get_start(self):
+        """
+        Returns the element from the front of the deque without removing it.
+
+        Returns:
+            int: The front element, or None if the deque is empty.
+        """
+        if self.number_of_elements == 0:
+            return None
+        return self.first.values[self.start]
+
+    def get_end(self):
+        """
+        Returns the element from the end of the deque without removing it.
+
+        Returns:
+            int: The end element, or None if the deque is empty.
+        """
+        if self.number_of_elements == 0:
+            return None
+        return self.last.values[self.end]
+
+    def to_array(self, out=None):
+        """
+        Copies the elements of the deque, from start to end, into an array,
+        with one slice copy per block.
+
+        Args:
+            out (np.ndarray): A preallocated array to fill, holding at least
+                as many elements as the deque, or None to allocate a new one.
+
+        Returns:
+            np.ndarray: The elements from start to end. When out is given, it
+                is the start of out that was filled.
+
+        Raises:
+            ValueError: If out is too small.
+        """
+        count = self.number_of_elements
+        if out is None:
+            out = np.empty(count, dtype=self.dtype)
+        elif len(out) < count:
+            raise ValueError(f'out holds {len(out)} elements, the deque {count}')
+
+        position = 0
+        block = self.first
+        begin = self.start
+        while position < count:
+            stop = self.end + 1 if block is self.last else self.block_size
+            out[position:position + stop - begin] = block.values[begin:stop]
+            position += stop - begin
+            block = block.next
+            begin = 0
+        return out[:count]
+
+    def display_deque(self):
+        """
+        Prints the current state of the deque.
+        """
+        if self.number_of_elements == 0:
+            print("Deque is empty")
+        else:
+            print("Deque:", self.to_array())
+
+
+if __name__ == '__main__':
+    # Tests
+    # The trace hook displays the deque after each operation
+    deque = Deque(5, trace=lambda operation, deque: deque.display_deque())
+    deque.insert_end(5)
+    deque.insert_end(10)
+    deque.insert_start(3)
+    deque.insert_start(2)
+    deque.insert_end(11)
+
+    # Attempt to insert when the deque is full
+    try:
+        deque.insert_start(43)
+    except DequeFullError as error:
+        print(error)  # The deque is full
+
+    deque.remove_start()
+    deque.remove_end()
+
+    deque.display_deque()
 
+    # Growable capacity: the wrapped elements keep their order
+    deque = Deque(2, growth_factor=2)
+    deque.insert_end(5)
+    deque.insert_start(3)
+    deque.insert_start(2)
+    deque.insert_end(11)
+    deque.display_deque()
 
-# Tests
-deque = Deque(5)
-deque.insert_end(5)
-deque.insert_end(10)
-deque.insert_start(3)
-deque.insert_start(2)
-deque.insert_end(11)
+    # Snapshots for monitoring: at most two views, or a copy into a buffer
+    print(deque.as_views())  # (array([2]), array([ 3,  5, 11]))
+    buffer = np.empty(8, dtype=int)
+    print(deque.to_array(out=buffer))  # [ 2  3  5 11]
 
-# Attempt to insert when the deque is full
-deque.insert_start(43)  # Should show that the deque is full
+    # Value-returning pops, bulk extends and rotation
+    deque = Deque(8)
+    deque.extend_right([1, 2, 3, 4])
+    deque.extend_left([0, -1])
+    deque.rotate(2)
+    print(deque.to_array())  # [ 3  4 -1  0  1  2]
+    print(deque.pop_left(), deque.pop_right())  # 3 2
 
-deque.remove_start()
-deque.remove_end()
+    # Rolling aggregates over the last 3 samples
+    aggregator = SlidingWindowAggregator(3)
+    for sample in [4.0, 1.0, 3.0]:
+        aggregator.push(sample)
+    print(aggregator.minimum(), aggregator.maximum(), aggregator.mean())  # 1.0 4.0 2.6666666666666665
+    batch = aggregator.push_many(np.arange(100.0))
+    print(batch[:2])  # [(0., 3., 4., 1.33333333) (0., 3., 4., 1.33333333)]
+    print(aggregator.minimum(), aggregator.maximum(), aggregator.sum())  # 97.0 99.0 294.0
 
-deque.display_deque()
\ No newline at end of file
+    # Unbounded deque of blocks: memory is released as it drains
+    blocks = BlockDeque(block_size=4)
+    blocks.extend_right(range(10))
+    blocks.insert_start(-1)
+    print(blocks.number_of_blocks, blocks.to_array())  # 3 [-1  0  1  2  3  4  5  6  7  8  9]
+    while blocks.number_of_elements > 2:
+        blocks.pop_left()
+    print(blocks.number_of_blocks, blocks.to_array())  # 1 [8 9]
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+##
+# Errors
+##
+'''
+The errors raised by more than one kind of container, defined once so that
+a single except clause catches them whichever container raised them. Errors
+raised by a single module (StackFullError, DequeFullError, ...) stay in it.
+'''
+
+from queue import Empty, Full
+
+
+class QueueFullError(Full):
+    """
+    Raised when an element is added to a full queue that cannot grow. It is
+    a queue.Full, so code written for the standard library queues catches it.
+    """
+
+
+class QueueEmptyError(Empty):
+    """
+    Raised when an element is removed from an empty queue. It is a
+    queue.Empty, so code written for the standard library queues catches it.
+    """
+
+
+class VectorFullError(Exception):
+    """
+    Raised when a value is inserted into a full vector that cannot grow.
+    """
+
+
+if __name__ == '__main__':
+    # Test
+    # Run as a script, this file is __main__: the containers raise the
+    # classes of the errors module
+    import errors
+    from circular_queue import CircularQueue
+    from priority_queue import PriorityQueue
+
+    # The circular and the priority queue raise the same error
+    for queue in [CircularQueue(1), PriorityQueue(1)]:
+        queue.enqueue(1)
+        try:
+            queue.enqueue(2)
+        except errors.QueueFullError as error:
+            print(type(queue).__name__, error)  # The queue is full
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+##
+# File-Backed Array
+##
+'''
+Memory-mapped file storage shared by the vectors.
+
+The file starts with a header that identifies the kind of container that
+wrote it and holds its dtype, capacity and size; the elements follow it, so
+growing the file keeps them in place.
+'''
+
+import os
+
+import numpy as np
+
+# Layout of the header at the start of a file-backed container; the
+# elements follow it, starting at FILE_HEADER_SIZE bytes
+FILE_HEADER = np.dtype([('magic', 'S8'), ('dtype', 'S8'),
+                        ('capacity', '<i8'), ('last_position', '<i8')])
+FILE_HEADER_SIZE = 64
+
+
+class FileBackedArray:
+    """
+    A mixin that keeps the elements of an array-backed container in a
+    memory-mapped file instead of memory.
+
+    The container sets self.path (None for a container kept in memory),
+    calls _open_file() from its __init__ when a path is given, keeps the
+    index of its last element in self.last_position, and calls
+    _grow_file() from its _resize() while it is file-backed.
+
+    Attributes:
+    path (str): The file backing the container, or None if it lives in memory.
+    file_magic (bytes): The 8 bytes that identify the kind of container in
+    the header of its file.
+
+    Methods:
+    flush(): Writes a file-backed container to disk.
+    _open_file(dtype, magic): Opens or creates the file backing the container.
+    _grow_file(capacity): Grows the file to a new capacity.
+    """
+
+    def _open_file(self, dtype, magic):
+        """
+        Opens the file backing the container, creating it if it does not
+        exist. An existing file sets the capacity, size and dtype.
+
+        Parameters:
+        dtype (numpy.dtype): The type of the elements of a new file.
+        magic (bytes): The 8 bytes that identify the kind of container.
+
+        Returns:
+        numpy.memmap: The elements of the container, mapped from the file.
+
+        Raises:
+        ValueError: If the file exists but was written by another kind of
+        container.
+
+        Time Complexity: O(1), since the elements are only read from disk when
+        they are accessed.
+        """
+        self.file_magic = magic
+        if os.path.exists(self.path):
+            header = np.fromfile(self.path, dtype=FILE_HEADER, count=1)
+            if header.size == 0 or header['magic'][0] != magic:
+                raise ValueError(f'{self.path} was not written by {type(self).__name__}')
+            dtype = np.dtype(header['dtype'][0].decode())
+            self.capacity = int(header['capacity'][0])
+            self.last_position = int(header['last_position'][0])
+        else:
+            dtype = np.dtype(dtype)
+            with open(self.path, 'wb') as file:
+                file.truncate(FILE_HEADER_SIZE + self.capacity * dtype.itemsize)
+
+        values = np.memmap(self.path, dtype=dtype, mode='r+',
+                           offset=FILE_HEADER_SIZE, shape=(self.capacity,))
+        self.__write_header(dtype)
+        return values
+
+    def _grow_file(self, capacity):
+        """
+        Grows the file to the given capacity and maps it again.
+
+        The elements are at the start of the file, so growing it keeps them
+        in place. The file never shrinks, so older views of the mapping stay
+        valid.
+
+        Parameters:
+        capacity (int): The new capacity of the container.
+
+        Time Complexity: O(k), where k is the number of changed pages.
+        """
+        dtype = self.values.dtype
+        self.values.flush()
+        self.values = None
+        with open(self.path, 'r+b') as file:
+            file.truncate(FILE_HEADER_SIZE + capacity * dtype.itemsize)
+        self.capacity = capacity
+        self.values = np.memmap(self.path, dtype=dtype, mode='r+',
+                                offset=FILE_HEADER_SIZE, shape=(capacity,))
+        self.__write_header(dtype)
+
+    def __write_header(self, dtype):
+        """
+        Writes the capacity, size and dtype of the container to its file.
+
+        Parameters:
+        dtype (numpy.dtype): The type of the elements.
+        """
+        header = np.array([(self.file_magic, dtype.str.encode(), self.capacity,
+                            self.last_position)], dtype=FILE_HEADER)
+        with open(self.path, 'r+b') as file:
+            file.write(header.tobytes())
+
+    def flush(self):
+        """
+        Writes a file-backed container to disk: the elements that changed and
+        a header with its capacity and size, so that creating a container
+        with the same path reopens it. Does nothing for a container kept in
+        memory.
+
+        Time Complexity: O(k), where k is the number of changed pages.
+        """
+        if self.path is None:
+            return
+        self.values.flush()
+        self.__write_header(self.values.dtype)
+
+
+if __name__ == '__main__':
+    # Test
+    import tempfile
+    from ordered_vector import OrderedVector
+    from unordered_vector import UnorderedVector
+
+    path = os.path.join(tempfile.mkdtemp(), 'vector.bin')
+    vector = OrderedVector(2, growth_factor=2, path=path)
+    vector.insert_many([5, 1, 3])
+    vector.flush()
+    reopened = OrderedVector(0, path=path)
+    print(reopened.values[:reopened.last_position + 1])  # [1 3 5]
+
+    # The magic in the header tells the kinds of vectors apart
+    try:
+        UnorderedVector(0, path=path)
+    except ValueError as error:
+        print(error)
@@ -7,7 +7,7 @@
 # Source: Artificial Intelligence - Stuart Russell and Peter Norvig
 ##
 
-import numpy as np
+from stack import Stack
 
 
 class Vertex:
@@ -140,75 +140,6 @@ graph.bucharest.show_adjacent()
 print()
 
 
-# Stack class for DFS
-class Stack:
-    """
-    Class to represent a stack data structure.
-    """
-    def __init__(self, capacity):
-        """
-        Initialize the stack with a given capacity.
-        
-        :param capacity: The maximum size of the stack
-        """
-        self.__capacity = capacity
-        self.__top = -1
-        self.__values = np.empty(self.__capacity, dtype=object)
-
-    def __is_full(self):
-        """
-        Check if the stack is full.
-        
-        :return: True if the stack is full, otherwise False
-        """
-        return self.__top == self.__capacity - 1
-
-    def __is_empty(self):
-        """
-        Check if the stack is empty.
-        
-        :return: True if the stack is empty, otherwise False
-        """
-        return self.__top == -1
-
-    def push(self, value):
-        """
-        Push a value onto the stack.
-        
-        :param value: The value to be pushed
-        """
-        if self.__is_full():
-            print('The stack is full')
-        else:
-            self.__top += 1
-            self.__values[self.__top] = value
-
-    def pop(self):
-        """
-        Pop a value from the stack.
-        
-        :return: The popped value, or None if the stack is empty
-        """
-        if self.__is_empty():
-            print('The stack is empty')
-            return None
-        else:
-            temp = self.__values[self.__top]
-            self.__top -= 1
-            return temp
-
-    def peek(self):
-        """
-        Get the top value of the stack without removing it.
-        
-        :return: The top value of the stack, or -1 if the stack is empty
-        """
-        if self.__top != -1:
-            return self.__values[self.__top]
-        else:
-            return -1
-
-
 # Perform Depth-First Search (DFS)
 class DepthFirstSearch:
     """
@@ -222,7 +153,7 @@ class DepthFirstSearch:
         """
         self.start = start
         self.start.visited = True
-        self.stack = Stack(20)
+        self.stack = Stack(20, dtype=object)
         self.stack.push(start)
 
     def search(self):
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+##
+# Growable Array
+##
+'''
+The growth policy shared by the array-backed containers (vectors, stack,
+queues and deque).
+
+By default the capacity of a container is fixed. With a growth factor the
+container grows geometrically instead of rejecting values when it is full,
+and with a shrink threshold it gives memory back when it becomes sparse.
+'''
+
+import numpy as np
+
+
+class GrowableArray:
+    """
+    A mixin that gives an array-backed container a growth policy.
+
+    The container calls super().__init__() first in its own __init__, so an
+    invalid policy is rejected before anything is allocated, and implements
+    _resize(capacity), which moves its elements to an array (or file) with
+    the new capacity and updates self.capacity.
+
+    Attributes:
+    growth_factor (float): The factor the capacity grows by when the
+    container is full, or None for a fixed capacity.
+    shrink_threshold (float): The fraction of the capacity below which the
+    container shrinks after a removal, or None to never shrink.
+    minimum_capacity (int): The capacity the container never shrinks below.
+
+    Methods:
+    reserve(capacity): Makes sure the container can hold a number of elements.
+    _ensure_capacity(required): Grows the container if the policy allows.
+    _shrink_if_sparse(size): Shrinks the container if it became sparse.
+    """
+
+    def __init__(self, capacity, growth_factor=None, shrink_threshold=None):
+        """
+        Sets the growth policy of the container.
+
+        Parameters:
+        capacity (int): The initial capacity of the container.
+        growth_factor (float): The factor the capacity is multiplied by when
+        the container is full (greater than 1, e.g. 2), or None for a fixed
+        capacity.
+        shrink_threshold (float): When, after a removal, fewer than
+        capacity * shrink_threshold elements are left, the capacity shrinks
+        back to the number of elements times the growth factor. It must be
+        smaller than 1 / growth_factor (1 / 2 without a growth factor), or
+        the container would grow and shrink again on every other operation.
+        None disables shrinking.
+
+        Raises:
+        ValueError: If growth_factor is not greater than 1, or if
+        shrink_threshold is not smaller than 1 / growth_factor.
+        """
+        if growth_factor is not None and growth_factor <= 1:
+            raise ValueError("'growth_factor' must be greater than 1")
+        if shrink_threshold is not None and shrink_threshold >= 1 / (growth_factor or 2):
+            raise ValueError("'shrink_threshold' must be smaller than 1 / growth_factor "
+                             "(1 / 2 without a growth factor)")
+
+        self.growth_factor = growth_factor
+        self.shrink_threshold = shrink_threshold
+        self.minimum_capacity = capacity
+
+    def _resize(self, capacity):
+        """
+        Moves the elements to a new array with the given capacity.
+        Implemented by each container.
+
+        Parameters:
+        capacity (int): The new capacity of the container.
+        """
+        raise NotImplementedError
+
+    def _ensure_capacity(self, required):
+        """
+        Makes sure the container can hold the required number of elements,
+        growing it if the growth policy allows.
+
+        Parameters:
+        required (int): The number of elements the container must be able
+        to hold.
+
+        Returns:
+        bool: True if the container has enough capacity, otherwise False.
+
+        Time Complexity: O(1) amortized.
+        """
+        if required <= self.capacity:
+            return True
+        if self.growth_factor is None:
+            return False
+
+        self._resize(max(required, int(np.ceil(self.capacity * self.growth_factor))))
+        return True
+
+    def _shrink_if_sparse(self, size):
+        """
+        Shrinks the container after a removal if it became sparser than the
+        shrink threshold.
+
+        Parameters:
+        size (int): The number of elements left in the container.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.shrink_threshold is None or self.capacity <= self.minimum_capacity:
+            return
+
+        if size < self.capacity * self.shrink_threshold:
+            factor = self.growth_factor or 2
+            self._resize(max(self.minimum_capacity, int(np.ceil(size * factor))))
+
+    def reserve(self, capacity):
+        """
+        Makes sure the container can hold at least the given number of
+        elements without growing again, even when its capacity is fixed. The
+        container never shrinks below a reserved capacity.
+
+        Parameters:
+        capacity (int): The number of elements to make room for.
+
+        Time Complexity: O(n), where n is the number of elements in the
+        container.
+        """
+        self.minimum_capacity = max(self.minimum_capacity, capacity)
+        if capacity > self.capacity:
+            self._resize(capacity)
+
+
+if __name__ == '__main__':
+    # Test
+    from stack import Stack
+
+    stack = Stack(2, dtype=int, growth_factor=2, shrink_threshold=0.25)
+    stack.push_many(range(5))
+    print(stack.capacity)  # 5
+    stack.pop_many(4)
+    print(stack.capacity)  # 2
+
+    # Settings that would grow and shrink on every other operation
+    try:
+        Stack(2, growth_factor=2, shrink_threshold=0.5)
+    except ValueError as error:
+        print(error)
@@ -11,11 +11,26 @@ Operations
 - Insertion: Adding elements;
 - Search: Finding an element;
 - Removal: Removing an element.
+
+Two backends are available: OrderedVector keeps every element in a single
+contiguous array, while ChunkedOrderedVector splits them into bounded
+sorted chunks so that an insertion only shifts the elements of one chunk.
 '''
 
+import os
+from bisect import bisect_left, bisect_right
+
 import numpy as np
 
-class OrderedVector:
+from errors import VectorFullError
+from file_backed_array import FileBackedArray
+from growable_array import GrowableArray
+
+# Identifies the files of file-backed vectors of this kind
+FILE_MAGIC = b'DSAORD01'
+
+
+class OrderedVector(GrowableArray, FileBackedArray):
     """
     A class that represents an ordered vector (or array), where the elements
     are stored in sorted order.
@@ -24,26 +39,90 @@ class OrderedVector:
     capacity (int): The maximum number of elements the vector can hold.
     last_position (int): The index of the last element in the vector.
     values (numpy.ndarray): The array that holds the elements of the vector.
+    growth_factor (float): The factor the capacity grows by when the vector
+    is full, or None for a fixed capacity.
+    shrink_threshold (float): The fraction of the capacity below which the
+    vector shrinks after a removal, or None to never shrink.
+    minimum_capacity (int): The capacity the vector never shrinks below.
+    path (str): The file backing the vector, or None if it lives in memory.
 
     Methods:
-    __init__(capacity): Initializes the ordered vector with a given capacity.
+    __init__(capacity, dtype, growth_factor, shrink_threshold, path): Initializes the ordered vector.
+    reserve(capacity): Makes sure the vector can hold a number of elements.
+    flush(): Writes a file-backed vector to disk.
     print_test(): Prints all elements in the vector.
     insert(value): Inserts a value into the vector in sorted order.
+    insert_many(array): Inserts a batch of values into the vector in sorted order.
     linear_search(value): Performs a linear search for a value in the vector.
     binary_search(value): Performs a binary search for a value in the vector.
+    binary_search_many(keys): Performs a binary search for each key in an array.
+    lower_bound(value): Returns the index of the first element >= value.
+    upper_bound(value): Returns the index of the first element > value.
+    count_between(lower, upper): Counts the values between two bounds.
+    rank(value): Returns the number of elements smaller than a value.
+    select(k): Returns the k-th smallest element.
+    range(lower, upper): Returns a view of the values between two bounds.
     delete(value): Removes a value from the vector.
+    delete_range(lower, upper): Removes all values between two bounds.
+    delete_many(values): Removes all occurrences of the given values.
     """
 
-    def __init__(self, capacity):
+    def __init__(self, capacity, dtype=int, growth_factor=None, shrink_threshold=None,
+                 path=None):
         """
         Initializes an ordered vector with a given capacity.
 
         Parameters:
-        capacity (int): The maximum capacity of the vector.
+        capacity (int): The initial capacity of the vector.
+        dtype (numpy.dtype): The numeric type of the elements, int (int64)
+        by default. Smaller types such as np.int32 or np.uint16 save memory.
+        growth_factor (float): The factor the capacity grows by when the
+        vector is full, or None for a fixed capacity (see GrowableArray).
+        shrink_threshold (float): The fraction of the capacity below which
+        the vector shrinks after a removal, or None to never shrink.
+        path (str): A file to keep the elements in, through a memory map,
+        instead of memory. If the file exists, the vector stored in it is
+        reopened and its own capacity, size and dtype are used. Call flush()
+        to make the changes durable. A file-backed vector never shrinks, since
+        truncating the file would invalidate views of it that are still in
+        use, so path cannot be combined with shrink_threshold.
+
+        Raises:
+        ValueError: If the growth policy is invalid (see GrowableArray), or
+        if both path and shrink_threshold are given.
         """
+        super().__init__(capacity, growth_factor, shrink_threshold)
+
+        if path is not None and shrink_threshold is not None:
+            raise ValueError('A file-backed vector cannot shrink: pass path or shrink_threshold, not both')
+
         self.capacity = capacity
         self.last_position = -1
-        self.values = np.empty(self.capacity, dtype=int)
+        self.path = path
+        if path is None:
+            self.values = np.empty(self.capacity, dtype=dtype)
+        else:
+            self.values = self._open_file(dtype, FILE_MAGIC)
+        self.minimum_capacity = self.capacity
+
+    def _resize(self, capacity):
+        """
+        Moves the elements to a new array with the given capacity.
+
+        Parameters:
+        capacity (int): The new capacity of the vector.
+
+        Time Complexity: O(n), where n is the number of elements in the vector.
+        """
+        if self.path is not None:
+            # A file-backed vector never shrinks (see __init__)
+            self._grow_file(capacity)
+            return
+
+        values = np.empty(capacity, dtype=self.values.dtype)
+        values[:self.last_position + 1] = self.values[:self.last_position + 1]
+        self.values = values
+        self.capacity = capacity
 
     def print_test(self):
         """
@@ -62,33 +141,74 @@ class OrderedVector:
         """
         Inserts a value into the ordered vector, maintaining the sorted order.
 
-        If the vector has reached its capacity, it prints a message and stops.
+        The insertion point is found with a binary search (after any values
+        equal to the new one) and the tail is shifted one position to the
+        right with a single slice move.
 
         Parameters:
         value (int): The value to be inserted into the vector.
 
-        Time Complexity: O(n), where n is the number of elements in the vector.
+        Raises:
+        VectorFullError: If the vector has reached its capacity and cannot
+        grow.
+
+        Time Complexity: O(log n) to find the position plus O(n) to shift the
+        tail, where n is the number of elements in the vector.
         """
-        if self.last_position == self.capacity - 1:
-            print('Maximum capacity reached')
-            return
+        if not self._ensure_capacity(self.last_position + 2):
+            raise VectorFullError('Maximum capacity reached')
 
-        position = 0
-        for i in range(self.last_position + 1):
-            position = i
-            if self.values[i] > value:
-                break
-            if i == self.last_position:
-                position = i + 1
+        # Search with the value as it will be stored (e.g. truncated to int)
+        value = self.values.dtype.type(value)
+        size = self.last_position + 1
+        position = int(np.searchsorted(self.values[:size], value, side='right'))
 
-        x = self.last_position
-        while x >= position:
-            self.values[x + 1] = self.values[x]
-            x -= 1
+        # Shift the tail one position to the right in a single block move
+        self.values[position + 1:size + 1] = self.values[position:size]
 
         self.values[position] = value
         self.last_position += 1
 
+    def insert_many(self, array):
+        """
+        Inserts a batch of values into the ordered vector, maintaining the
+        sorted order.
+
+        The batch is sorted and merged with the current elements in a single
+        pass. As in insert(), a new value is placed after any values equal to
+        it that are already in the vector.
+
+        Parameters:
+        array (array-like): The values to be inserted into the vector.
+
+        Raises:
+        VectorFullError: If the batch does not fit in the remaining capacity
+        and the vector cannot grow. Nothing is inserted then.
+
+        Time Complexity: O(k log k + k log n + n), where k is the size of the
+        batch and n is the number of elements in the vector.
+        """
+        batch = np.sort(np.asarray(array, dtype=self.values.dtype).ravel())
+        size = self.last_position + 1
+        total = size + batch.size
+
+        if not self._ensure_capacity(total):
+            raise VectorFullError('Maximum capacity reached')
+
+        # Final position of each new value: its insertion point among the
+        # current elements plus the number of new values placed before it
+        positions = np.searchsorted(self.values[:size], batch, side='right')
+        positions += np.arange(batch.size)
+
+        merged = np.empty(total, dtype=self.values.dtype)
+        is_old = np.ones(total, dtype=bool)
+        is_old[positions] = False
+        merged[positions] = batch
+        merged[is_old] = self.values[:size]
+
+        self.values[:total] = merged
+        self.last_position = total - 1
+
     def linear_search(self, value):
         """
         Performs a linear search to find the given value in the vector.
@@ -141,47 +261,641 @@ class OrderedVector:
                 else:
                     upper_limit = current_position - 1
 
+    def binary_search_many(self, keys):
+        """
+        Performs a binary search for every key of an array at once.
+
+        All the searches run inside numpy, so a batch of keys costs about the
+        same Python overhead as a single call to binary_search(). The keys are
+        sorted first, so consecutive searches walk the vector in order and
+        reuse the cache lines touched by the previous one.
+
+        Parameters:
+        keys (array-like): The values to search for.
+
+        Returns:
+        numpy.ndarray: For each key, the index of its first occurrence in the
+        vector, or -1 if it is not found.
+
+        Time Complexity: O(k log k + k log n), where k is the number of keys
+        and n is the number of elements in the vector.
+        """
+        keys = np.asarray(keys)
+        size = self.last_position + 1
+        if size == 0:
+            return np.full(keys.shape, -1, dtype=np.intp)
+
+        order = np.argsort(keys, axis=None)
+        sorted_keys = keys.ravel()[order]
+        positions = np.empty(keys.size, dtype=np.intp)
+        positions[order] = np.searchsorted(self.values[:size], sorted_keys, side='left')
+        positions = positions.reshape(keys.shape)
+
+        found = self.values[np.minimum(positions, size - 1)] == keys
+        return np.where(found, positions, -1)
+
+    def lower_bound(self, value):
+        """
+        Finds the index of the first element that is not smaller than the
+        given value.
+
+        Parameters:
+        value (int): The value to search for.
+
+        Returns:
+        int: The index of the first element >= value, or the number of
+        elements if there is none.
+
+        Time Complexity: O(log n), where n is the number of elements in the vector.
+        """
+        return int(np.searchsorted(self.values[:self.last_position + 1], value, side='left'))
+
+    def upper_bound(self, value):
+        """
+        Finds the index of the first element that is greater than the given
+        value.
+
+        Parameters:
+        value (int): The value to search for.
+
+        Returns:
+        int: The index of the first element > value, or the number of
+        elements if there is none.
+
+        Time Complexity: O(log n), where n is the number of elements in the vector.
+        """
+        return int(np.searchsorted(self.values[:self.last_position + 1], value, side='right'))
+
+    def count_between(self, lower, upper):
+        """
+        Counts the values v such that lower <= v <= upper.
+
+        Parameters:
+        lower (int): The lower bound (inclusive).
+        upper (int): The upper bound (inclusive).
+
+        Returns:
+        int: The number of values between the bounds.
+
+        Time Complexity: O(log n), where n is the number of elements in the vector.
+        """
+        return max(self.upper_bound(upper) - self.lower_bound(lower), 0)
+
+    def rank(self, value):
+        """
+        Returns the rank of a value, that is, the number of elements in the
+        vector that are smaller than it.
+
+        Parameters:
+        value (int): The value to rank.
+
+        Returns:
+        int: The number of elements smaller than the value.
+
+        Time Complexity: O(log n), where n is the number of elements in the vector.
+        """
+        return self.lower_bound(value)
+
+    def select(self, k):
+        """
+        Returns the k-th smallest element of the vector (counting from 0).
+
+        Parameters:
+        k (int): The rank of the element.
+
+        Returns:
+        int: The k-th smallest element, or None if k is out of range.
+
+        Time Complexity: O(1)
+        """
+        if k < 0 or k > self.last_position:
+            return None
+        return self.values[k]
+
+    def range(self, lower, upper):
+        """
+        Returns the values v such that lower <= v <= upper.
+
+        The result is a view of the vector's storage, so no data is copied.
+        It reflects later changes to the vector and should not be modified.
+
+        Parameters:
+        lower (int): The lower bound (inclusive).
+        upper (int): The upper bound (inclusive).
+
+        Returns:
+        numpy.ndarray: A view of the values between the bounds.
+
+        Time Complexity: O(log n), where n is the number of elements in the vector.
+        """
+        start = self.lower_bound(lower)
+        return self.values[start:max(self.upper_bound(upper), start)]
+
     def delete(self, value):
         """
         Removes a value from the vector, if it exists.
 
+        The value is located with a binary search and the tail is shifted one
+        position to the left with a single slice move. If the value appears
+        more than once, its first occurrence is removed.
+
         Parameters:
         value (int): The value to be removed from the vector.
 
         Returns:
         int: -1 if the value is not found, otherwise the vector is updated.
 
-        Time Complexity: O(n), where n is the number of elements in the vector.
+        Time Complexity: O(log n) to find the value plus O(n) to shift the
+        tail, where n is the number of elements in the vector.
         """
-        position = self.linear_search(value)
-        if position == -1:
+        size = self.last_position + 1
+        position = int(np.searchsorted(self.values[:size], value, side='left'))
+        if position == size or self.values[position] != value:
             return -1
         else:
-            for i in range(position, self.last_position):
-                self.values[i] = self.values[i + 1]
+            self.values[position:size - 1] = self.values[position + 1:size]
 
             self.last_position -= 1
+            self._shrink_if_sparse(self.last_position + 1)
+
+    def delete_range(self, lower, upper):
+        """
+        Removes all values v such that lower <= v <= upper.
+
+        Both bounds are located with a binary search and the tail is moved
+        over the removed block with a single slice move.
+
+        Parameters:
+        lower (int): The smallest value to be removed.
+        upper (int): The largest value to be removed.
+
+        Returns:
+        int: The number of values removed.
+
+        Time Complexity: O(log n + n), where n is the number of elements in
+        the vector.
+        """
+        size = self.last_position + 1
+        start = self.lower_bound(lower)
+        stop = self.upper_bound(upper)
+        if stop <= start:
+            return 0
+
+        removed = stop - start
+        self.values[start:size - removed] = self.values[stop:size]
+        self.last_position -= removed
+        self._shrink_if_sparse(self.last_position + 1)
+        return removed
+
+    def delete_many(self, values):
+        """
+        Removes every occurrence of each of the given values.
+
+        Each distinct value is located with a binary search, which marks a
+        block of equal elements; the remaining elements are then compacted
+        to the front of the vector in a single pass.
+
+        Parameters:
+        values (array-like): The values to be removed from the vector.
 
+        Returns:
+        int: The number of values removed.
+
+        Time Complexity: O(k log k + k log n + n), where k is the number of
+        values given and n is the number of elements in the vector.
+        """
+        size = self.last_position + 1
+        keys = np.unique(np.asarray(values).ravel())
+        starts = np.searchsorted(self.values[:size], keys, side='left')
+        stops = np.searchsorted(self.values[:size], keys, side='right')
+        found = stops > starts
+        if not found.any():
+            return 0
+
+        # Mark the start and the end of each block of equal elements; the
+        # running sum is positive exactly inside the blocks to be removed
+        marks = np.zeros(size + 1, dtype=np.int64)
+        marks[starts[found]] += 1
+        marks[stops[found]] -= 1
+        kept = self.values[:size][np.cumsum(marks[:size]) == 0]
+
+        self.values[:kept.size] = kept
+        self.last_position = kept.size - 1
+        self._shrink_if_sparse(self.last_position + 1)
+        return size - kept.size
+
+
+class ChunkedOrderedVector:
+    """
+    A class that represents an ordered vector stored as a list of bounded
+    sorted chunks instead of a single contiguous array.
+
+    Each chunk is a numpy array of chunk_size positions, and a small index
+    with the largest value of every chunk tells which chunk a value belongs
+    to. Insertions and removals only shift the elements of one chunk; full
+    chunks are split in two and nearly empty chunks are merged with a
+    neighbour.
+
+    Attributes:
+    chunk_size (int): The maximum number of elements in a chunk.
+    last_position (int): The index of the last element in the vector.
+    chunks (list): The numpy arrays that hold the elements, in order.
+    counts (list): The number of elements in each chunk.
+    maxima (list): The largest element of each chunk.
+
+    Methods:
+    __init__(chunk_size, dtype): Initializes an empty chunked ordered vector.
+    __len__(): Returns the number of elements in the vector.
+    __iter__(): Iterates over the elements in sorted order.
+    print_test(): Prints all elements in the vector.
+    insert(value): Inserts a value into the vector in sorted order.
+    insert_many(array): Inserts a batch of values into the vector in sorted order.
+    binary_search(value): Performs a binary search for a value in the vector.
+    delete(value): Removes a value from the vector.
+    """
+
+    def __init__(self, chunk_size=1024, dtype=int):
+        """
+        Initializes an empty chunked ordered vector. It has no capacity
+        limit: chunks are added as the vector grows.
+
+        Parameters:
+        chunk_size (int): The maximum number of elements in a chunk, at
+        least 2.
+        dtype (numpy.dtype): The numeric type of the elements, int (int64)
+        by default.
+
+        Raises:
+        ValueError: If chunk_size is smaller than 2.
+        """
+        # A full chunk is split in two halves, which must not be empty
+        if chunk_size < 2:
+            raise ValueError("'chunk_size' must be at least 2")
+        self.chunk_size = chunk_size
+        self.dtype = np.dtype(dtype)
+        self.last_position = -1
+        self.chunks = []
+        self.counts = []
+        self.maxima = []
+        # Global index of the first element of each chunk, followed by the
+        # number of elements, kept up to date by every change
+        self.__offsets = np.zeros(1, dtype=np.int64)
+
+    def __len__(self):
+        """
+        Returns the number of elements in the vector.
+
+        Time Complexity: O(1)
+        """
+        return self.last_position + 1
+
+    def __iter__(self):
+        """
+        Iterates over the elements of the vector in sorted order.
+
+        Time Complexity: O(n), where n is the number of elements in the vector.
+        """
+        for chunk, count in zip(self.chunks, self.counts):
+            yield from chunk[:count]
+
+    def __offset(self, index):
+        """
+        Returns the global index of the first element of a chunk.
+
+        Parameters:
+        index (int): The index of the chunk.
+
+        Returns:
+        int: The number of elements stored in the chunks before it.
+
+        Time Complexity: O(1)
+        """
+        return int(self.__offsets[index])
+
+    def __new_chunk(self, values):
+        """
+        Allocates a chunk holding a copy of the given sorted values.
+
+        Parameters:
+        values (numpy.ndarray): The sorted values of the chunk.
+
+        Returns:
+        numpy.ndarray: The new chunk.
+        """
+        chunk = np.empty(self.chunk_size, dtype=self.dtype)
+        chunk[:values.size] = values
+        return chunk
+
+    def __split(self, index):
+        """
+        Splits a full chunk in two halves.
+
+        Parameters:
+        index (int): The index of the chunk.
+
+        Time Complexity: O(b + c), where b is the chunk size and c is the
+        number of chunks.
+        """
+        chunk = self.chunks[index]
+        count = self.counts[index]
+        half = count // 2
+
+        self.chunks.insert(index + 1, self.__new_chunk(chunk[half:count]))
+        self.counts.insert(index + 1, count - half)
+        self.maxima.insert(index + 1, self.maxima[index])
+
+        self.counts[index] = half
+        self.maxima[index] = chunk[half - 1].item()
+        self.__offsets = np.insert(self.__offsets, index + 1, self.__offsets[index] + half)
+
+    def __merge_if_sparse(self, index):
+        """
+        Removes an empty chunk, or merges a chunk that is less than a quarter
+        full into its smaller neighbour when both fit comfortably in one chunk.
+
+        Parameters:
+        index (int): The index of the chunk.
+
+        Time Complexity: O(b + c), where b is the chunk size and c is the
+        number of chunks.
+        """
+        count = self.counts[index]
+        if count == 0:
+            del self.chunks[index]
+            del self.counts[index]
+            del self.maxima[index]
+            self.__offsets = np.delete(self.__offsets, index + 1)
+            return
+        if count >= self.chunk_size // 4 or len(self.chunks) == 1:
+            return
+
+        # Pick the smaller neighbour and merge the right chunk into the left
+        if index == 0 or (index + 1 < len(self.chunks)
+                          and self.counts[index + 1] < self.counts[index - 1]):
+            left = index
+        else:
+            left = index - 1
+        total = self.counts[left] + self.counts[left + 1]
+        if total > self.chunk_size * 3 // 4:
+            return
+
+        self.chunks[left][self.counts[left]:total] = self.chunks[left + 1][:self.counts[left + 1]]
+        self.counts[left] = total
+        self.maxima[left] = self.maxima[left + 1]
+        del self.chunks[left + 1]
+        del self.counts[left + 1]
+        del self.maxima[left + 1]
+        self.__offsets = np.delete(self.__offsets, left + 1)
+
+    def print_test(self):
+        """
+        Prints all the elements in the vector. If the vector is empty, it
+        will print a message indicating that.
+
+        Time Complexity: O(n), where n is the number of elements in the vector.
+        """
+        if self.last_position == -1:
+            print("The vector is empty")
+        else:
+            for i, value in enumerate(self):
+                print(i, ' - ', value)
 
-# Test
-vector = OrderedVector(10)
-vector.insert(8)
-vector.insert(9)
-vector.insert(4)
-vector.insert(1)
-vector.insert(5)
-vector.insert(7)
-vector.insert(11)
-vector.insert(13)
-vector.insert(2)
+    def insert(self, value):
+        """
+        Inserts a value into the vector, maintaining the sorted order.
+
+        The chunk is found with a binary search over the chunk maxima and the
+        value is placed after any values equal to it, as in
+        OrderedVector.insert(). A chunk that becomes full is split in two.
+
+        Parameters:
+        value (int): The value to be inserted into the vector.
 
-vector.print_test()
+        Time Complexity: O(log n + b + c), where n is the number of elements
+        in the vector, b is the chunk size and c is the number of chunks,
+        whose offsets are shifted in a single numpy operation.
+        """
+        value = self.dtype.type(value)
+        if not self.chunks:
+            self.chunks.append(np.empty(self.chunk_size, dtype=self.dtype))
+            self.counts.append(0)
+            self.maxima.append(value.item())
+            self.__offsets = np.zeros(2, dtype=np.int64)
+
+        # First chunk whose largest value is greater than the new one, or the
+        # last chunk if the new value is the largest
+        index = min(bisect_right(self.maxima, value), len(self.chunks) - 1)
+        chunk = self.chunks[index]
+        count = self.counts[index]
+        position = int(np.searchsorted(chunk[:count], value, side='right'))
+
+        chunk[position + 1:count + 1] = chunk[position:count]
+        chunk[position] = value
+        self.counts[index] = count + 1
+        if position == count:
+            self.maxima[index] = value.item()
+        self.__offsets[index + 1:] += 1
+
+        if count + 1 == self.chunk_size:
+            self.__split(index)
+        self.last_position += 1
 
-print(20 * '-' )
+    def insert_many(self, array):
+        """
+        Inserts a batch of values into the vector, maintaining the sorted
+        order.
+
+        A batch smaller than the number of chunks is inserted one value at a
+        time, touching only the chunks it lands in. A larger batch is sorted,
+        merged with the current elements and the chunks are rebuilt half
+        full, leaving room for later insertions.
+
+        Parameters:
+        array (array-like): The values to be inserted into the vector.
+
+        Time Complexity: O(k (log c + chunk_size)) for a small batch, or
+        O(k log k + n) for a large one, where k is the size of the batch, c
+        the number of chunks and n the number of elements in the vector.
+        """
+        batch = np.sort(np.asarray(array, dtype=self.dtype).ravel())
+        if batch.size < len(self.chunks):
+            for value in batch.tolist():
+                self.insert(value)
+            return
 
-vector.binary_search(7)
-vector.binary_search(5)
-vector.binary_search(13)
-vector.binary_search(20)
+        current = np.concatenate([chunk[:count] for chunk, count in zip(self.chunks, self.counts)]
+                                 + [np.empty(0, dtype=self.dtype)])
+        positions = np.searchsorted(current, batch, side='right') + np.arange(batch.size)
+
+        merged = np.empty(current.size + batch.size, dtype=self.dtype)
+        is_old = np.ones(merged.size, dtype=bool)
+        is_old[positions] = False
+        merged[positions] = batch
+        merged[is_old] = current
+
+        step = self.chunk_size // 2
+        self.chunks = [self.__new_chunk(merged[i:i + step]) for i in range(0, merged.size, step)]
+        self.counts = [min(step, merged.size - i) for i in range(0, merged.size, step)]
+        self.maxima = [merged[min(i + step, merged.size) - 1].item() for i in range(0, merged.size, step)]
+        self.last_position = merged.size - 1
+        self.__offsets = np.minimum(np.arange(len(self.chunks) + 1) * step, merged.size)
+
+    def binary_search(self, value):
+        """
+        Performs a binary search to find the given value in the vector.
+
+        Parameters:
+        value (int): The value to search for.
+
+        Returns:
+        int: The index of the first occurrence of the value if found,
+        otherwise -1.
+
+        Time Complexity: O(log n), where n is the number of elements in the
+        vector.
+        """
+        index = bisect_left(self.maxima, value)
+        if index == len(self.chunks):
+            return -1
+
+        chunk = self.chunks[index]
+        position = int(np.searchsorted(chunk[:self.counts[index]], value, side='left'))
+        if chunk[position] != value:
+            return -1
+        return self.__offset(index) + position
+
+    def delete(self, value):
+        """
+        Removes a value from the vector, if it exists. If the value appears
+        more than once, its first occurrence is removed.
+
+        Parameters:
+        value (int): The value to be removed from the vector.
+
+        Returns:
+        int: -1 if the value is not found, otherwise the vector is updated.
+
+        Time Complexity: O(log n + b + c), where n is the number of elements
+        in the vector, b is the chunk size and c is the number of chunks,
+        whose offsets are shifted in a single numpy operation.
+        """
+        index = bisect_left(self.maxima, value)
+        if index == len(self.chunks):
+            return -1
+
+        chunk = self.chunks[index]
+        count = self.counts[index]
+        position = int(np.searchsorted(chunk[:count], value, side='left'))
+        if chunk[position] != value:
+            return -1
 
-vector.print_test()
+        chunk[position:count - 1] = chunk[position + 1:count]
+        self.counts[index] = count - 1
+        if position == count - 1 and count > 1:
+            self.maxima[index] = chunk[count - 2].item()
+        self.__offsets[index + 1:] -= 1
+
+        self.__merge_if_sparse(index)
+        self.last_position -= 1
+
+
+if __name__ == '__main__':
+    # Test
+    vector = OrderedVector(10)
+    vector.insert(8)
+    vector.insert(9)
+    vector.insert(4)
+    vector.insert(1)
+    vector.insert(5)
+    vector.insert(7)
+    vector.insert(11)
+    vector.insert(13)
+    vector.insert(2)
+
+    vector.print_test()
+
+    print(20 * '-' )
+
+    vector.binary_search(7)
+    vector.binary_search(5)
+    vector.binary_search(13)
+    vector.binary_search(20)
+
+    vector.print_test()
+
+    print(20 * '-' )
+
+    # Batch insertion
+    vector = OrderedVector(10)
+    vector.insert(5)
+    vector.insert(9)
+    vector.insert_many([7, 1, 5, 12])
+    vector.print_test()
+
+    print(20 * '-' )
+
+    # Deletion
+    vector.delete(5)
+    vector.delete_range(8, 10)
+    vector.delete_many([1, 12, 20])
+    vector.print_test()
+
+    print(20 * '-' )
+
+    # Range queries
+    vector = OrderedVector(10)
+    vector.insert_many([1, 3, 3, 5, 8, 13])
+    print(vector.lower_bound(3), vector.upper_bound(3))  # 1 3
+    print(vector.count_between(2, 8))  # 4
+    print(vector.rank(5), vector.select(4))  # 3 8
+    print(vector.range(3, 8))  # [3 3 5 8]
+    print(vector.binary_search_many([3, 4, 13]))  # [ 1 -1  5]
+
+    print(20 * '-' )
+
+    # Growable capacity
+    vector = OrderedVector(2, growth_factor=2, shrink_threshold=0.25)
+    vector.insert_many([4, 2, 9, 7, 1])
+    print(vector.capacity)  # 5
+    vector.delete_range(2, 9)
+    print(vector.capacity)  # 2
+
+    print(20 * '-' )
+
+    # Smaller element types
+    vector = OrderedVector(4, dtype=np.uint16)
+    vector.insert_many([300, 7, 65535])
+    vector.insert(42)
+    vector.print_test()
+    print(vector.values.nbytes)  # 8
+
+    print(20 * '-' )
+
+    # File-backed vector, reopened from disk
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), 'ordered_vector.bin')
+    vector = OrderedVector(4, growth_factor=2, path=path)
+    vector.insert_many([8, 2, 5, 3, 13])
+    vector.flush()
+    reopened = OrderedVector(0, path=path)
+    reopened.print_test()
+
+    print(20 * '-' )
+
+    # Chunked backend
+    chunked = ChunkedOrderedVector(chunk_size=4)
+    for value in [8, 9, 4, 1, 5, 7, 11, 13, 2]:
+        chunked.insert(value)
+    chunked.delete(5)
+    chunked.print_test()
+    print(chunked.binary_search(11))  # 6
+
+    print(20 * '-' )
+
+    # A full vector raises instead of printing
+    vector = OrderedVector(1)
+    vector.insert(1)
+    try:
+        vector.insert(2)
+    except VectorFullError as error:
+        print(error)  # Maximum capacity reached
@@ -6,22 +6,53 @@
 
 import numpy as np
 
-class PriorityQueue:
+from errors import QueueEmptyError, QueueFullError
+from growable_array import GrowableArray
+
+
+class PriorityQueue(GrowableArray):
     """
     A Priority Queue implementation using an array where elements are inserted 
     in descending order of priority (highest priority first).
     """
 
-    def __init__(self, capacity):
+    def __init__(self, capacity, dtype=int, growth_factor=None, shrink_threshold=None, trace=None):
         """
         Initializes the priority queue with a given capacity.
 
         Args:
-            capacity (int): Maximum number of elements the queue can hold.
+            capacity (int): Initial number of elements the queue can hold.
+            dtype (numpy.dtype): Numeric type of the elements, int (int64)
+                by default. Smaller types such as np.int32 or np.uint16 save
+                memory.
+            growth_factor (float): Factor the capacity grows by when the
+                queue is full, or None for a fixed capacity (see
+                GrowableArray).
+            shrink_threshold (float): Fraction of the capacity below which
+                the queue shrinks after a dequeue, or None to never shrink.
+            trace (callable): A diagnostics hook, called as
+                trace(operation, queue) after each enqueue or dequeue, e.g.
+                trace=lambda operation, queue: queue.display_queue(). The
+                default None costs a single check per operation.
         """
+        super().__init__(capacity, growth_factor, shrink_threshold)
+
         self.capacity = capacity
         self.number_of_elements = 0
-        self.values = np.empty(self.capacity, dtype=int)
+        self.values = np.empty(self.capacity, dtype=dtype)
+        self.trace = trace
+
+    def _resize(self, capacity):
+        """
+        Moves the elements to a new array with the given capacity.
+
+        Args:
+            capacity (int): The new capacity of the queue.
+        """
+        values = np.empty(capacity, dtype=self.values.dtype)
+        values[:self.number_of_elements] = self.values[:self.number_of_elements]
+        self.values = values
+        self.capacity = capacity
 
     def __is_empty(self):
         """
@@ -48,11 +79,11 @@ class PriorityQueue:
         Args:
             value (int): The value to be added to the queue.
 
-        If the queue is full, a message is printed.
+        Raises:
+            QueueFullError: If the queue is full and cannot grow.
         """
-        if self.__is_full():
-            print('The queue is full')
-            return
+        if self.__is_full() and not self._ensure_capacity(self.number_of_elements + 1):
+            raise QueueFullError('The queue is full')
 
         if self.number_of_elements == 0:
             self.values[self.number_of_elements] = value
@@ -68,8 +99,8 @@ class PriorityQueue:
             self.values[x + 1] = value
             self.number_of_elements += 1
 
-        self.display_queue()
-
+        if self.trace is not None:
+            self.trace('enqueue', self)
 
     def dequeue(self):
         """
@@ -78,16 +109,17 @@ class PriorityQueue:
         Returns:
             int: The element with the highest priority.
 
-        If the queue is empty, a message is printed.
+        Raises:
+            QueueEmptyError: If the queue is empty.
         """
         if self.__is_empty():
-            print('The queue is empty')
-            return
+            raise QueueEmptyError('The queue is empty')
 
         value = self.values[self.number_of_elements - 1]
         self.number_of_elements -= 1
-        print(f'Dequeued: {value}')
-        self.display_queue()
+        self._shrink_if_sparse(self.number_of_elements)
+        if self.trace is not None:
+            self.trace('dequeue', self)
         return value
 
     def first(self):
@@ -111,17 +143,152 @@ class PriorityQueue:
             print("Queue:", self.values[:self.number_of_elements])
 
 
-# Tests
-queue = PriorityQueue(5)
-queue.enqueue(30)
-queue.enqueue(50)
-queue.enqueue(10)
-queue.enqueue(40)
-queue.enqueue(20)
-queue.dequeue()
-queue.dequeue()
-queue.dequeue()
-queue.enqueue(5)
-
-# Display the current state of the queue
-queue.display_queue()
+class HeapPriorityQueue(PriorityQueue):
+    """
+    A Priority Queue backed by a binary min-heap stored in an array.
+
+    It has the same semantics as PriorityQueue, whose highest priority
+    element is the smallest value, but keeps the array heap-ordered instead
+    of sorted: the element at index i is never larger than its children at
+    2i + 1 and 2i + 2. An enqueue or dequeue then moves an element along a
+    single path of the tree, in O(log n) instead of the O(n) shift of the
+    sorted array.
+
+    Only the order of the array differs, so the capacity, growth and shrink
+    handling of PriorityQueue are inherited: resizing copies the elements
+    index by index, which keeps the heap order.
+    """
+
+    def enqueue(self, value):
+        """
+        Adds an element to the priority queue.
+
+        The new element starts at the first free index and moves up, past
+        every parent larger than it, to keep the heap order. Parents are
+        moved down into the hole instead of swapped, so each level costs a
+        single write.
+
+        Args:
+            value (int): The value to be added to the queue.
+
+        Raises:
+            QueueFullError: If the queue is full and cannot grow.
+        """
+        if not self._ensure_capacity(self.number_of_elements + 1):
+            raise QueueFullError('The queue is full')
+
+        values = self.values
+        value = values.dtype.type(value)
+        hole = self.number_of_elements
+        while hole > 0:
+            parent = (hole - 1) >> 1
+            if values[parent] <= value:
+                break
+            values[hole] = values[parent]
+            hole = parent
+        values[hole] = value
+        self.number_of_elements += 1
+
+        if self.trace is not None:
+            self.trace('enqueue', self)
+
+    def dequeue(self):
+        """
+        Removes and returns the element with the highest priority (the
+        smallest one, at the root of the heap).
+
+        The last element takes the place of the root and moves down, past
+        every smaller child, to keep the heap order.
+
+        Returns:
+            int: The element with the highest priority.
+
+        Raises:
+            QueueEmptyError: If the queue is empty.
+        """
+        if self.number_of_elements == 0:
+            raise QueueEmptyError('The queue is empty')
+
+        values = self.values
+        top = values[0]
+        self.number_of_elements -= 1
+        size = self.number_of_elements
+        if size > 0:
+            value = values[size]
+            hole = 0
+            child = 1
+            while child < size:
+                # Move towards the smaller child
+                if child + 1 < size and values[child + 1] < values[child]:
+                    child += 1
+                if value <= values[child]:
+                    break
+                values[hole] = values[child]
+                hole = child
+                child = 2 * hole + 1
+            values[hole] = value
+
+        self._shrink_if_sparse(self.number_of_elements)
+        if self.trace is not None:
+            self.trace('dequeue', self)
+        return top
+
+    def first(self):
+        """
+        Returns the element with the highest priority without removing it.
+
+        Returns:
+            int: The element with the highest priority, or -1 if the queue is empty.
+        """
+        if self.number_of_elements == 0:
+            return -1
+        return self.values[0]
+
+    def display_queue(self):
+        """
+        Prints the current state of the priority queue, in the same order as
+        PriorityQueue (the highest priority last).
+        """
+        if self.number_of_elements == 0:
+            print("Queue is empty")
+        else:
+            print("Queue:", np.sort(self.values[:self.number_of_elements])[::-1])
+
+
+if __name__ == '__main__':
+    # Tests
+    # The trace hook displays the queue after each operation
+    queue = PriorityQueue(5, trace=lambda operation, queue: queue.display_queue())
+    queue.enqueue(30)
+    queue.enqueue(50)
+    queue.enqueue(10)
+    queue.enqueue(40)
+    queue.enqueue(20)
+    print(f'Dequeued: {queue.dequeue()}')
+    print(f'Dequeued: {queue.dequeue()}')
+    print(f'Dequeued: {queue.dequeue()}')
+    queue.enqueue(5)
+
+    # Display the current state of the queue
+    queue.display_queue()
+
+    # Growable capacity
+    queue = PriorityQueue(2, growth_factor=2)
+    queue.enqueue(30)
+    queue.enqueue(10)
+    queue.enqueue(20)
+    queue.display_queue()
+
+    # An empty queue raises instead of printing
+    queue = PriorityQueue(1)
+    try:
+        queue.dequeue()
+    except QueueEmptyError as error:
+        print(error)  # The queue is empty
+
+    # Heap backend: same results, O(log n) per operation
+    queue = HeapPriorityQueue(5)
+    for value in [30, 50, 10, 40, 20]:
+        queue.enqueue(value)
+    print(queue.dequeue(), queue.dequeue(), queue.first())  # 10 20 30
+    queue.display_queue()  # Queue: [50 40 30]
@@ -4,9 +4,39 @@
 # Stacks
 ##
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
-class Stack:
+from growable_array import GrowableArray
+
+# Each closing bracket and the opening bracket it must match
+MATCHING_BRACKETS = {')': '(', ']': '[', '}': '{'}
+OPENING_BRACKETS = set(MATCHING_BRACKETS.values())
+# Unicode code points of all brackets, used to skip every other character
+BRACKET_CODES = np.array([ord(char) for char in '()[]{}'])
+OPENING_CODES = np.array([ord(char) for char in '([{'])
+# Code of the opening bracket matched by each closing bracket code
+MATCHING_CODES = np.zeros(128, dtype=np.uint8)
+for closing, opening in MATCHING_BRACKETS.items():
+    MATCHING_CODES[ord(closing)] = ord(opening)
+
+
+class StackFullError(Exception):
+    """
+    Raised when an element is pushed onto a full stack that cannot grow.
+    """
+
+
+class StackEmptyError(IndexError):
+    """
+    Raised when an element is popped from an empty stack. Like list.pop(),
+    it is an IndexError.
+    """
+
+
+class Stack(GrowableArray):
     """
     A class that represents a stack data structure.
 
@@ -16,27 +46,65 @@ class Stack:
     Attributes:
     capacity (int): The maximum capacity of the stack.
     top (int): The index of the top element in the stack.
-    values (np.chararray): An array that holds the elements of the stack.
+    values (np.ndarray): An array that holds the elements of the stack.
+    growth_factor (float): The factor the capacity grows by when the stack
+    is full, or None for a fixed capacity.
+    shrink_threshold (float): The fraction of the capacity below which the
+    stack shrinks after a pop, or None to never shrink.
+    minimum_capacity (int): The capacity the stack never shrinks below.
+    trace (callable): Called as trace(operation, stack) after each push or
+    pop, or None.
 
     Methods:
     __stack_full(): Checks if the stack is full.
     stack_empty(): Checks if the stack is empty.
+    reserve(capacity): Makes sure the stack can hold a number of elements.
     push(value): Adds an element to the top of the stack.
+    push_many(array): Adds several elements to the top of the stack.
     pop(): Removes and returns the top element from the stack.
+    pop_many(k): Removes the top k elements and returns a view of them.
     peek(): Returns the top element of the stack without removing it.
+    peek_many(k): Returns a view of the top k elements without removing them.
     """
 
-    def __init__(self, capacity):
+    def __init__(self, capacity, dtype='U1', growth_factor=None, shrink_threshold=None, trace=None):
         """
         Initializes a new stack with a given capacity.
 
         Parameters:
-        capacity (int): The maximum capacity of the stack.
+        capacity (int): The initial capacity of the stack.
+        dtype (numpy.dtype): The type of the elements. The default 'U1'
+        holds single characters (e.g. brackets); a numeric type such as
+        np.int64 holds numbers, and object holds any Python object.
+        growth_factor (float): The factor the capacity grows by when the
+        stack is full, or None for a fixed capacity (see GrowableArray).
+        shrink_threshold (float): The fraction of the capacity below which
+        the stack shrinks after a pop, or None to never shrink.
+        trace (callable): A diagnostics hook, called as trace(operation,
+        stack) after each push or pop, e.g. to log the stack. The default
+        None costs a single check per operation.
         """
+        super().__init__(capacity, growth_factor, shrink_threshold)
+
         self.capacity = capacity
         self.top = -1
         # Array to hold elements (e.g., '(')
-        self.values = np.chararray(self.capacity, unicode=True)
+        self.values = np.empty(self.capacity, dtype=dtype)
+        self.trace = trace
+
+    def _resize(self, capacity):
+        """
+        Moves the elements to a new array with the given capacity.
+
+        Parameters:
+        capacity (int): The new capacity of the stack.
+
+        Time Complexity: O(n), where n is the number of elements in the stack.
+        """
+        values = np.empty(capacity, dtype=self.values.dtype)
+        values[:self.top + 1] = self.values[:self.top + 1]
+        self.values = values
+        self.capacity = capacity
 
     def __stack_full(self):
         """
@@ -60,18 +128,58 @@ class Stack:
         """
         Pushes an element onto the stack.
 
-        Adds the provided element to the top of the stack if there is space.
+        Adds the provided element to the top of the stack if there is space,
+        growing the stack first when it is full and has a growth factor.
 
         Parameters:
         value (str): The element to be added to the stack.
 
-        Time Complexity: O(1), since insertion occurs at the top of the stack.
+        Raises:
+        StackFullError: If the stack is full and cannot grow.
+
+        Time Complexity: O(1) amortized, since insertion occurs at the top of
+        the stack.
         """
-        if self.__stack_full():
-            print('The stack is full')
+        if self.__stack_full() and not self._ensure_capacity(self.top + 2):
+            raise StackFullError('The stack is full')
+
+        self.top += 1
+        self.values[self.top] = value
+        if self.trace is not None:
+            self.trace('push', self)
+
+    def push_many(self, array):
+        """
+        Pushes several elements onto the stack with a single slice copy. The
+        last element of the array ends up at the top of the stack.
+
+        With dtype=object, each item of the sequence is pushed as it is, so
+        a list of tuples pushes the tuples rather than their contents.
+
+        Parameters:
+        array (array-like): The elements to be added to the stack.
+
+        Raises:
+        StackFullError: If the elements do not fit and the stack cannot grow.
+        Nothing is pushed then.
+
+        Time Complexity: O(k) amortized, where k is the number of elements.
+        """
+        if self.values.dtype == object:
+            # np.asarray would turn nested items (e.g. tuples) into more
+            # dimensions, depending on their shapes
+            items = list(array)
+            array = np.fromiter(items, dtype=object, count=len(items))
         else:
-            self.top += 1
-            self.values[self.top] = value
+            array = np.asarray(array, dtype=self.values.dtype).ravel()
+        count = array.size
+        if not self._ensure_capacity(self.top + 1 + count):
+            raise StackFullError('The stack is full')
+
+        self.values[self.top + 1:self.top + 1 + count] = array
+        self.top += count
+        if self.trace is not None:
+            self.trace('push_many', self)
 
     def pop(self):
         """
@@ -80,17 +188,48 @@ class Stack:
         Removes and returns the element at the top of the stack.
 
         Returns:
-        str: The popped element if the stack is not empty, otherwise -1.
+        str: The popped element.
 
-        Time Complexity: O(1), since the top element is removed directly.
+        Raises:
+        StackEmptyError: If the stack is empty.
+
+        Time Complexity: O(1) amortized, since the top element is removed
+        directly.
         """
         if self.stack_empty():
-            print('The stack is empty')
-            return -1
-        else:
-            value = self.values[self.top]
-            self.top -= 1
-            return value
+            raise StackEmptyError('The stack is empty')
+
+        value = self.values[self.top]
+        self.top -= 1
+        self._shrink_if_sparse(self.top + 1)
+        if self.trace is not None:
+            self.trace('pop', self)
+        return value
+
+    def pop_many(self, k):
+        """
+        Pops up to k elements from the stack.
+
+        The result is a view of the stack's storage in pop order (the old top
+        first), so no data is copied. Later pushes overwrite it: copy it to
+        keep the values.
+
+        Parameters:
+        k (int): The number of elements to pop. If the stack holds fewer,
+        all of them are popped.
+
+        Returns:
+        np.ndarray: A view of the popped elements, top first.
+
+        Time Complexity: O(1), plus O(n) if the stack shrinks, where n is the
+        number of elements in the stack.
+        """
+        values = self.peek_many(k)
+        self.top -= values.size
+        self._shrink_if_sparse(self.top + 1)
+        if self.trace is not None:
+            self.trace('pop_many', self)
+        return values
 
     def peek(self):
         """
@@ -109,30 +248,287 @@ class Stack:
         else:
             return -1
 
+    def peek_many(self, k):
+        """
+        Returns up to k elements from the top of the stack without removing
+        them, as a view in pop order (the top first).
+
+        Parameters:
+        k (int): The number of elements to return. If the stack holds fewer,
+        all of them are returned.
+
+        Returns:
+        np.ndarray: A view of the top elements, top first.
+
+        Time Complexity: O(1)
+        """
+        count = min(max(k, 0), self.top + 1)
+        return self.values[self.top + 1 - count:self.top + 1][::-1]
+
+
+def find_bracket_error(expression):
+    """
+    Checks if the brackets of an expression are balanced, one character at a
+    time, using a stack of the brackets still open.
+
+    Parameters:
+    expression (str): The expression to check.
+
+    Returns:
+    int: The position of the first closing bracket that does not match,
+    len(expression) if some bracket is never closed, or -1 if the
+    brackets are balanced.
+
+    Time Complexity: O(n), where n is the length of the expression.
+    """
+    stack = Stack(len(expression))
+
+    for i in range(len(expression)):
+        char = expression[i]
+        if char in OPENING_BRACKETS:
+            stack.push(char)
+        elif char in MATCHING_BRACKETS:
+            if stack.stack_empty() or str(stack.pop()) != MATCHING_BRACKETS[char]:
+                return i
+    if not stack.stack_empty():
+        return len(expression)
+    return -1
+
 
-# Test
-
-# Example expressions to check for balanced brackets
-# c[d]
-# a{b[c]d}e
-# a{b(c]d}e
-# a[b{c}d]e}
-# a{b(c)
-
-expression = str(input('Enter an expression: '))
-stack = Stack(len(expression))
-
-for i in range(len(expression)):
-    char = expression[i]
-    if char == '{' or char == '[' or char == '(':
-        stack.push(char)
-    elif char == '}' or char == ']' or char == ')':
-        if not stack.stack_empty():  # Now this works since the method is public
-            popped_char = str(stack.pop())
-            if (char == '}' and popped_char != '{') or (char == ']' and popped_char != '[') or (char == ')' and popped_char != '('):
-                print(f'Error: {char} at position {i}')
-                break
+def read_chunks(source, chunk_size):
+    """
+    Splits a source of text into chunks.
+
+    Parameters:
+    source: A path, which is read in binary mode, an open file (text or
+    binary), or an iterable of str or bytes chunks.
+    chunk_size (int): The number of characters (or bytes) read at a time
+    from a path or file.
+
+    Returns:
+    iterator: The chunks of the source, in order.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from iter(lambda: file.read(chunk_size), b'')
+    elif hasattr(source, 'read'):
+        yield from iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        yield from source
+
+
+def find_bracket_error_stream(source, chunk_size=1 << 20):
+    """
+    Checks if the brackets of a text are balanced, reading it in chunks.
+
+    Each chunk is turned into a numpy array of character codes and the
+    positions of the brackets are found with a vectorized comparison, so
+    the Python loop only visits the brackets. The stack grows and shrinks
+    with the nesting depth, so memory is bounded by the chunk size plus the
+    depth, not by the size of the input.
+
+    Positions count characters for text chunks and bytes for binary chunks
+    (including paths, which are read in binary mode). Brackets are ASCII,
+    so both agree for ASCII input and UTF-8 never hides a bracket inside a
+    multi-byte character.
+
+    Parameters:
+    source: A path, an open file (text or binary), or an iterable of str
+    or bytes chunks.
+    chunk_size (int): The number of characters (or bytes) read at a time
+    from a path or file.
+
+    Returns:
+    int: The same result as find_bracket_error() for the whole text: the
+    position of the first closing bracket that does not match, the length
+    of the text if some bracket is never closed, or -1 if the brackets are
+    balanced.
+
+    Time Complexity: O(n + b), where n is the length of the text and b is
+    the number of brackets in it.
+    """
+    stack = Stack(64, growth_factor=2, shrink_threshold=0.25)
+    offset = 0
+
+    for chunk in read_chunks(source, chunk_size):
+        if isinstance(chunk, str):
+            codes = np.frombuffer(chunk.encode('utf-32-le'), dtype=np.uint32)
         else:
-            print(f'Error: {char} at position {i}')
-if not stack.stack_empty():  # Also using the public method here
-    print('Error!')
+            codes = np.frombuffer(chunk, dtype=np.uint8)
+
+        positions = np.flatnonzero(np.isin(codes, BRACKET_CODES))
+        for position, code in zip(positions.tolist(), codes[positions].tolist()):
+            char = chr(code)
+            if char in OPENING_BRACKETS:
+                stack.push(char)
+            elif stack.stack_empty() or str(stack.pop()) != MATCHING_BRACKETS[char]:
+                return offset + position
+        offset += codes.size
+
+    if not stack.stack_empty():
+        return offset
+    return -1
+
+
+def summarize_bracket_chunk(path, start, length):
+    """
+    Reduces a chunk of a file to what the rest of the file needs to know
+    about its brackets: the closing brackets that were not opened inside the
+    chunk, the first mismatch inside the chunk, and the brackets left open.
+
+    Parameters:
+    path (str): The file to read.
+    start (int): The offset of the chunk in the file, in bytes.
+    length (int): The length of the chunk, in bytes.
+
+    Returns:
+    tuple: The positions (in the file) and codes of the unmatched closing
+    brackets, in order, the position of the first closing bracket that
+    mismatches a bracket opened in the chunk (-1 if none), and the codes
+    of the brackets still open at the end of the chunk, from the bottom of
+    the stack to the top.
+
+    Time Complexity: O(n + b log b), where n is the length of the chunk and
+    b is the number of brackets in it.
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        codes = np.frombuffer(file.read(length), dtype=np.uint8)
+
+    positions = np.flatnonzero(np.isin(codes, BRACKET_CODES))
+    brackets = codes[positions]
+    is_opening = np.isin(brackets, OPENING_CODES)
+    # Depth of the stack after each bracket, relative to the chunk start
+    depth = np.cumsum(np.where(is_opening, 1, -1))
+
+    # A closing bracket that takes the depth below every earlier depth (and
+    # below 0) pops a bracket opened in an earlier chunk
+    lowest_before = np.minimum.accumulate(np.concatenate(([0], depth[:-1])))
+    unmatched_closing = ~is_opening & (depth < lowest_before)
+    # An opening bracket is still open at the end if the depth never goes
+    # back below it
+    lowest_after = np.minimum.accumulate(depth[::-1])[::-1]
+    lowest_after = np.concatenate((lowest_after[1:], [np.iinfo(depth.dtype).max]))
+    unmatched_opening = is_opening & (depth <= lowest_after)
+
+    # Every other bracket is matched inside the chunk. Grouped by the depth
+    # they open or close, they alternate opening, closing, opening, ...
+    matched = np.flatnonzero(~(unmatched_closing | unmatched_opening))
+    level = depth[matched] + ~is_opening[matched]
+    pairs = matched[np.argsort(level, kind='stable')]
+    opening, closing = pairs[0::2], pairs[1::2]
+    wrong = MATCHING_CODES[brackets[closing]] != brackets[opening]
+    error = int(positions[closing[wrong]].min()) if wrong.any() else -1
+
+    # Brackets after the first error do not matter
+    closers = np.flatnonzero(unmatched_closing)
+    if error != -1:
+        closers = closers[positions[closers] < error]
+        error += start
+    return start + positions[closers], brackets[closers], error, brackets[unmatched_opening]
+
+
+def find_bracket_error_parallel(path, chunk_size=64 << 20, workers=None):
+    """
+    Checks if the brackets of a file are balanced, splitting it into chunks
+    that are summarized in parallel by a pool of processes.
+
+    Each chunk is reduced by summarize_bracket_chunk() on its own, without
+    a Python loop over its brackets. The summaries are then merged in file
+    order with a single stack of bracket codes: the unmatched closing
+    brackets of a chunk are compared with the top of the stack in one
+    vectorized comparison and pop the brackets left open by the chunks
+    before it, and its open brackets are pushed for the next ones. A chunk
+    can only report a mismatch between two of its own brackets, so the
+    first error found while merging is the first error of the file.
+
+    Parameters:
+    path (str): The file to check. Positions are counted in bytes.
+    chunk_size (int): The size of the chunks, in bytes.
+    workers (int): The number of processes, or None for one per core.
+
+    Returns:
+    int: The same result as find_bracket_error_stream(path): the position
+    of the first closing bracket that does not match, the size of the file
+    if some bracket is never closed, or -1 if the brackets are balanced.
+
+    Time Complexity: O((n + b log b) / p + u), where n is the size of the
+    file, b the number of brackets, p the number of processes and u the
+    number of brackets left unmatched inside the chunks, merged with numpy
+    operations rather than a Python loop.
+    """
+    size = os.path.getsize(path)
+    starts = range(0, size, chunk_size)
+    stack = Stack(64, dtype=np.uint8, growth_factor=2, shrink_threshold=0.25)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        summaries = executor.map(summarize_bracket_chunk, [path] * len(starts), starts,
+                                 [chunk_size] * len(starts))
+        for closer_positions, closer_codes, error, openers in summaries:
+            # The i-th unmatched closing bracket of the chunk pops the i-th
+            # bracket from the top of the stack
+            tops = stack.peek_many(closer_codes.size)
+            wrong = np.flatnonzero(MATCHING_CODES[closer_codes[:tops.size]] != tops)
+            if wrong.size:
+                return int(closer_positions[wrong[0]])
+            if tops.size < closer_codes.size:
+                # The stack runs out: nothing is open for this bracket
+                return int(closer_positions[tops.size])
+            if error != -1:
+                return error
+            stack.pop_many(closer_codes.size)
+            stack.push_many(openers)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    if not stack.stack_empty():
+        return size
+    return -1
+
+
+if __name__ == '__main__':
+    # Test
+
+    # Example expressions to check for balanced brackets
+    # c[d]
+    # a{b[c]d}e
+    # a{b(c]d}e
+    # a[b{c}d]e}
+    # a{b(c)
+
+    expression = str(input('Enter an expression: '))
+    position = find_bracket_error(expression)
+    if position == len(expression):
+        print('Error!')
+    elif position != -1:
+        print(f'Error: {expression[position]} at position {position}')
+
+    # Streaming check, reading the expression 3 characters at a time
+    import io
+    print(find_bracket_error_stream(io.StringIO(expression), chunk_size=3) == position)  # True
+
+    # Parallel check of the same expression saved to a file, in 4-byte chunks
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), 'expression.txt')
+    with open(path, 'w') as file:
+        file.write(expression)
+    print(find_bracket_error_parallel(path, chunk_size=4, workers=2) == position)  # True
+
+    # Typed stacks with batch operations
+    numbers = Stack(4, dtype=np.int64, growth_factor=2)
+    numbers.push_many([1, 2, 3, 4, 5])
+    print(numbers.peek_many(2))  # [5 4]
+    print(numbers.pop_many(3))  # [5 4 3]
+    print(numbers.pop(), numbers.capacity)  # 2 8
+
+    words = Stack(2, dtype=object)
+    words.push('Arad')
+    words.push('Bucharest')
+    print(words.pop())  # Bucharest
+
+    # A full or empty stack raises instead of printing
+    try:
+        words.push_many(['Sibiu', 'Fagaras'])
+    except StackFullError as error:
+        print(error)  # The stack is full
@@ -13,9 +13,24 @@ Operations
 - Removal: Removing an element.
 '''
 
+import os
+from bisect import bisect_left, insort
+
 import numpy as np
 
-class UnorderedVector:
+from errors import VectorFullError
+from file_backed_array import FileBackedArray
+from growable_array import GrowableArray
+
+# Identifies the files of file-backed vectors of this kind
+FILE_MAGIC = b'DSAUNO01'
+
+# An indexed vector rebuilds its index once the removed positions it has to
+# correct for exceed this fraction of its elements
+INDEX_COMPACTION_FRACTION = 1 / 16
+
+
+class UnorderedVector(GrowableArray, FileBackedArray):
     """
     A class that represents an unordered vector (or array), where elements 
     are stored without any particular order or sorting.
@@ -24,25 +39,110 @@ class UnorderedVector:
     capacity (int): The maximum number of elements the vector can hold.
     last_position (int): The index of the last element in the vector.
     values (numpy.ndarray): The array that holds the elements of the vector.
+    growth_factor (float): The factor the capacity grows by when the vector
+    is full, or None for a fixed capacity.
+    shrink_threshold (float): The fraction of the capacity below which the
+    vector shrinks after a removal, or None to never shrink.
+    minimum_capacity (int): The capacity the vector never shrinks below.
+    path (str): The file backing the vector, or None if it lives in memory.
 
     Methods:
-    __init__(capacity): Initializes the unordered vector with a given capacity.
+    __init__(capacity, dtype, growth_factor, shrink_threshold, indexed, path): Initializes the unordered vector.
+    __contains__(value): Checks if a value is in the unordered vector.
+    reserve(capacity): Makes sure the vector can hold a number of elements.
+    flush(): Writes a file-backed vector to disk.
     print_test(): Prints all elements in the unordered vector.
     insert(value): Adds a new value to the unordered vector.
     linear_search(value): Performs a linear search to find the position of a value.
     remove(value): Removes a value from the unordered vector.
+    remove_fast(value): Removes a value by moving the last element into its place.
+    remove_many(values): Removes all occurrences of the given values.
+    remove_where(mask): Removes the elements selected by a boolean mask.
     """
 
-    def __init__(self, capacity):
+    def __init__(self, capacity, dtype=int, growth_factor=None, shrink_threshold=None,
+                 indexed=False, path=None):
         """
         Initializes an unordered vector with a given capacity.
 
         Parameters:
-        capacity (int): The maximum capacity of the vector.
+        capacity (int): The initial capacity of the vector.
+        dtype (numpy.dtype): The numeric type of the elements, int (int64)
+        by default. Smaller types such as np.int32 or np.uint16 save memory.
+        growth_factor (float): The factor the capacity grows by when the
+        vector is full, or None for a fixed capacity (see GrowableArray).
+        shrink_threshold (float): The fraction of the capacity below which
+        the vector shrinks after a removal, or None to never shrink.
+        indexed (bool): Whether to keep a hash index from each value to its
+        positions, which makes linear_search() and membership tests
+        O(log n).
+        path (str): A file to keep the elements in, through a memory map,
+        instead of memory. If the file exists, the vector stored in it is
+        reopened and its own capacity, size and dtype are used. Call flush()
+        to make the changes durable. A file-backed vector never shrinks, since
+        truncating the file would invalidate views of it that are still in
+        use, so path cannot be combined with shrink_threshold.
+
+        Raises:
+        ValueError: If the growth policy is invalid (see GrowableArray), or
+        if both path and shrink_threshold are given.
         """
+        super().__init__(capacity, growth_factor, shrink_threshold)
+
+        if path is not None and shrink_threshold is not None:
+            raise ValueError('A file-backed vector cannot shrink: pass path or shrink_threshold, not both')
+
         self.capacity = capacity
         self.last_position = -1
-        self.values = np.empty(self.capacity, dtype=int)
+        self.path = path
+        if path is None:
+            self.values = np.empty(self.capacity, dtype=dtype)
+        else:
+            self.values = self._open_file(dtype, FILE_MAGIC)
+        self.minimum_capacity = self.capacity
+        # Maps each stored value to the sorted list of its positions. Values
+        # are added lazily, so only positions below __indexed are covered.
+        # The positions are not rewritten when an element is removed: the
+        # removed positions are kept, sorted, in __removed instead, and a
+        # position in the index moves left by the number of removed ones
+        # before it
+        self.__index = {} if indexed else None
+        self.__indexed = 0
+        self.__removed = []
+
+    def _resize(self, capacity):
+        """
+        Moves the elements to a new array with the given capacity.
+
+        Parameters:
+        capacity (int): The new capacity of the vector.
+
+        Time Complexity: O(n), where n is the number of elements in the vector.
+        """
+        if self.path is not None:
+            # A file-backed vector never shrinks (see __init__)
+            self._grow_file(capacity)
+            return
+
+        values = np.empty(capacity, dtype=self.values.dtype)
+        values[:self.last_position + 1] = self.values[:self.last_position + 1]
+        self.values = values
+        self.capacity = capacity
+
+    def __contains__(self, value):
+        """
+        Checks if a value is in the unordered vector.
+
+        Parameters:
+        value (int): The value to search for.
+
+        Returns:
+        bool: True if the value is in the vector, otherwise False.
+
+        Time Complexity: O(log n) amortized with an index, otherwise O(n),
+        where n is the number of elements in the vector.
+        """
+        return self.linear_search(value) != -1
 
     def print_test(self):
         """
@@ -61,32 +161,47 @@ class UnorderedVector:
         """
         Inserts a value into the unordered vector.
 
-        If the vector has reached its maximum capacity, it prints a message 
-        indicating that no more elements can be inserted.
-
         Parameters:
         value (int): The value to be inserted into the vector.
 
-        Time Complexity: O(1), since insertion happens at the end of the vector.
+        Raises:
+        VectorFullError: If the vector has reached its maximum capacity and
+        cannot grow.
+
+        Time Complexity: O(1) amortized, since insertion happens at the end of
+        the vector.
         """
-        if self.last_position == self.capacity - 1:
-            print("Maximum capacity reached")
-        else:
-            self.last_position += 1
-            self.values[self.last_position] = value
+        if not self._ensure_capacity(self.last_position + 2):
+            raise VectorFullError('Maximum capacity reached')
+
+        self.last_position += 1
+        self.values[self.last_position] = value
 
     def linear_search(self, value):
         """
         Performs a linear search to find the given value in the unordered vector.
 
+        If the vector has an index, the position is read from it instead of
+        scanning the vector. Values inserted since the last lookup are added
+        to the index first, so insert() itself pays nothing for it.
+
         Parameters:
         value (int): The value to search for.
 
         Returns:
-        int: The index of the value if found, otherwise -1.
+        int: The index of the first occurrence of the value if found,
+        otherwise -1.
 
-        Time Complexity: O(n), where n is the number of elements in the vector.
+        Time Complexity: O(log n) amortized with an index, otherwise O(n),
+        where n is the number of elements in the vector.
         """
+        if self.__index is not None:
+            self.__update_index()
+            positions = self.__index.get(value)
+            if not positions:
+                return -1
+            return positions[0] - bisect_left(self.__removed, positions[0])
+
         for i in range(self.last_position + 1):
             if value == self.values[i]:
                 return i
@@ -94,7 +209,8 @@ class UnorderedVector:
 
     def remove(self, value):
         """
-        Removes the specified value from the unordered vector if it exists.
+        Removes the first occurrence of the specified value from the
+        unordered vector if it exists, keeping the order of the others.
 
         Parameters:
         value (int): The value to be removed from the vector.
@@ -108,32 +224,221 @@ class UnorderedVector:
         if position == -1:
             return -1
         else:
-            for i in range(position, self.last_position):
-                self.values[i] = self.values[i + 1]
+            self.values[position:self.last_position] = self.values[position + 1:self.last_position + 1]
 
             self.last_position -= 1
+            if self.__index is not None:
+                self.__unindex(self.__pop_position(value, 0))
+            self._shrink_if_sparse(self.last_position + 1)
+
+    def remove_fast(self, value):
+        """
+        Removes the first occurrence of the specified value by moving the
+        last element into its place. The order of the elements is not kept.
+
+        Parameters:
+        value (int): The value to be removed from the vector.
+
+        Returns:
+        int: -1 if the value is not found, otherwise the vector is updated.
+
+        Time Complexity: O(1) to remove the element, plus the search for it.
+        """
+        position = self.linear_search(value)
+        if position == -1:
+            return -1
+
+        last = self.last_position
+        moved = self.values[last].item()
+        self.values[position] = self.values[last]
+        self.last_position -= 1
+
+        if self.__index is not None:
+            slot = self.__pop_position(value, 0)
+            if position != last:
+                # The moved element was the last one, so it is the largest
+                # position in its list. It takes over the slot of the removed
+                # value, and its own slot is the one that goes away
+                vacated = self.__pop_position(moved, -1)
+                insort(self.__index.setdefault(moved, []), slot)
+                slot = vacated
+            self.__unindex(slot)
+        self._shrink_if_sparse(self.last_position + 1)
+
+    def remove_many(self, values):
+        """
+        Removes every occurrence of each of the given values, keeping the
+        order of the remaining elements.
+
+        Parameters:
+        values (array-like): The values to be removed from the vector.
+
+        Returns:
+        int: The number of values removed.
+
+        Time Complexity: O((n + k) log k), where n is the number of elements
+        in the vector and k is the number of values given.
+        """
+        return self.remove_where(np.isin(self.values[:self.last_position + 1], values))
+
+    def remove_where(self, mask):
+        """
+        Removes the elements selected by a boolean mask, keeping the order of
+        the remaining elements. The remaining elements are compacted to the
+        front of the vector in a single pass.
+
+        Parameters:
+        mask (array-like): A boolean array with one entry per element, True
+        for the elements to be removed.
+
+        Returns:
+        int: The number of values removed.
+
+        Time Complexity: O(n), where n is the number of elements in the vector.
+        """
+        size = self.last_position + 1
+        kept = self.values[:size][~np.asarray(mask, dtype=bool)]
+        if kept.size == size:
+            return 0
+
+        self.values[:kept.size] = kept
+        self.last_position = kept.size - 1
+        if self.__index is not None:
+            # Most positions changed: rebuild the index on the next lookup
+            self.__index = {}
+            self.__indexed = 0
+            self.__removed = []
+        self._shrink_if_sparse(self.last_position + 1)
+        return size - kept.size
+
+    def __update_index(self):
+        """
+        Adds the values inserted since the last update to the index.
+
+        Time Complexity: O(k), where k is the number of values added.
+        """
+        size = self.last_position + 1
+        start = self.__indexed
+        # Every removed position comes before the new elements
+        for position, key in enumerate(self.values[start:size].tolist(),
+                                       start + len(self.__removed)):
+            # Positions only grow, so appending keeps each list sorted
+            self.__index.setdefault(key, []).append(position)
+        self.__indexed = size
+
+    def __pop_position(self, key, i):
+        """
+        Removes one of the positions of a value from the index.
+
+        Parameters:
+        key (int): The value.
+        i (int): The index of the position in the sorted list of positions
+        of the value, 0 for the first one or -1 for the last one.
+
+        Returns:
+        int: The position, as stored in the index.
+        """
+        positions = self.__index[key]
+        slot = positions.pop(i)
+        if not positions:
+            del self.__index[key]
+        return slot
+
+    def __unindex(self, slot):
+        """
+        Records that the element at a position stored in the index was
+        removed and the elements after it moved one position to the left.
+        The index itself is not rewritten: once enough positions have been
+        removed, it is dropped and rebuilt in one pass by the next lookup.
+
+        Parameters:
+        slot (int): The position of the removed element, as stored in the
+        index.
+
+        Time Complexity: O(r), a single move of the sorted list of removed
+        positions, where r is the number of them (at most n / 16 for n
+        elements), plus O(1) amortized for the rebuilds.
+        """
+        insort(self.__removed, slot)
+        self.__indexed = self.last_position + 1
+        if len(self.__removed) > (self.last_position + 1) * INDEX_COMPACTION_FRACTION:
+            self.__index = {}
+            self.__indexed = 0
+            self.__removed = []
+
+
+if __name__ == '__main__':
+    # Tests
+    vector = UnorderedVector(10)
+
+    # Insertion
+    vector.insert(2)
+    vector.insert(8)
+    vector.insert(5)
+    vector.insert(1)
+    vector.insert(6)
+    vector.insert(4)
+
+    vector.print_test()
+
+    print(20 * '-' )
+
+    # Search - shows the position of the element 8
+    print(vector.linear_search(8)) # Should return the index of 8
+
+    print(20 * '-' )
+
+    # Remove the element 8
+    vector.remove(8)
+    vector.print_test()
+
+    print(20 * '-' )
+
+    # Growable capacity
+    vector = UnorderedVector(2, growth_factor=2)
+    for value in [3, 7, 1, 9, 4]:
+        vector.insert(value)
+    print(vector.capacity)  # 8
+    vector.print_test()
 
+    print(20 * '-' )
 
-# Tests
-vector = UnorderedVector(10)
+    # Hash index
+    vector = UnorderedVector(10, indexed=True)
+    for value in [5, 3, 5, 9]:
+        vector.insert(value)
+    vector.remove(5)
+    print(vector.linear_search(5), 9 in vector, 4 in vector)  # 1 True False
 
-# Insertion
-vector.insert(2)
-vector.insert(8)
-vector.insert(5)
-vector.insert(1)
-vector.insert(6)
-vector.insert(4)
+    print(20 * '-' )
 
-vector.print_test()
+    # Bulk and unordered removal
+    vector = UnorderedVector(10)
+    for value in [4, 8, 15, 16, 23, 42, 8]:
+        vector.insert(value)
+    vector.remove_fast(4)  # 8 takes its place
+    vector.remove_many([15, 16])
+    vector.remove_where(vector.values[:vector.last_position + 1] > 40)
+    vector.print_test()  # 8 8 23
 
-print(20 * '-' )
+    print(20 * '-' )
 
-# Search - shows the position of the element 8
-print(vector.linear_search(8)) # Should return the index of 8
+    # File-backed vector, reopened from disk
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), 'unordered_vector.bin')
+    vector = UnorderedVector(4, growth_factor=2, path=path)
+    for value in [8, 2, 5, 3, 13]:
+        vector.insert(value)
+    vector.flush()
+    reopened = UnorderedVector(0, path=path)
+    reopened.print_test()
 
-print(20 * '-' )
+    print(20 * '-' )
 
-# Remove the element 8
-vector.remove(8)
-vector.print_test()
+    # A full vector raises instead of printing
+    vector = UnorderedVector(1)
+    vector.insert(1)
+    try:
+        vector.insert(2)
+    except VectorFullError as error:
+        print(error)  # Maximum capacity reached